@@ -9,16 +9,23 @@ This package contains all specialized agents for code analysis:
 - Code Quality Agent
 - Algorithm Visualization Agent
 - Fix Suggestion Agent
+
+Agent modules are imported lazily (PEP 562) so callers that need only
+one agent don't pay for loading the other six modules.
 """
 
-from .base_agent import BaseAgent
-from .error_detector import ErrorDetectorAgent
-from .complexity_analyzer import ComplexityAnalyzerAgent
-from .memory_profiler import MemoryProfilerAgent
-from .security_analyzer import SecurityAnalyzerAgent
-from .quality_checker import QualityCheckerAgent
-from .algorithm_visualizer import AlgorithmVisualizerAgent
-from .fix_suggester import FixSuggesterAgent
+import importlib
+
+_LAZY_AGENTS = {
+    'BaseAgent': '.base_agent',
+    'ErrorDetectorAgent': '.error_detector',
+    'ComplexityAnalyzerAgent': '.complexity_analyzer',
+    'MemoryProfilerAgent': '.memory_profiler',
+    'SecurityAnalyzerAgent': '.security_analyzer',
+    'QualityCheckerAgent': '.quality_checker',
+    'AlgorithmVisualizerAgent': '.algorithm_visualizer',
+    'FixSuggesterAgent': '.fix_suggester'
+}
 
 __all__ = [
     'BaseAgent',
@@ -30,3 +37,12 @@ __all__ = [
     'AlgorithmVisualizerAgent',
     'FixSuggesterAgent'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_AGENTS:
+        module = importlib.import_module(_LAZY_AGENTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,267 @@
 import ast
+import copy
+import hashlib
 import re
+from collections import OrderedDict, deque
+from types import MappingProxyType
 from typing import Dict, Any, List
 from .base_agent import BaseAgent
 
+# Optional PCRE backend: python-pcre JIT-compiles patterns to native code,
+# which pays off here because the same class-level patterns are reused on
+# every request. Falls back to the stdlib engine when not installed.
+try:
+    import pcre as _regex_engine
+    HAS_PCRE_JIT = True
+except ImportError:
+    _regex_engine = re
+    HAS_PCRE_JIT = False
+
+# Analysis is deterministic in (code, language), so repeat submissions of
+# the same snippet (common from IDE/CI clients) are served from an LRU
+# cache keyed on a BLAKE2b content hash instead of re-running the scans.
+_ANALYSIS_CACHE: OrderedDict = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 256
+
+# Sample inputs for the canned visualizations. The frame sequences they
+# produce never vary between calls, so they are simulated once at import
+# time and frozen as tuples instead of being rebuilt per request.
+_SORT_SAMPLE = [64, 34, 25, 12, 22, 11, 90]
+_SEARCH_SAMPLE = [11, 12, 22, 25, 34, 64, 90]
+_SEARCH_TARGET = 25
+_GRAPH_SAMPLE = {
+    0: [1, 2],
+    1: [0, 3, 4],
+    2: [0, 5],
+    3: [1],
+    4: [1, 5],
+    5: [2, 4]
+}
+
+
+# Op codes for the compact simulation rows below.
+_OP_COMPARE = 0
+_OP_SWAP = 1
+
+# The sample array has only a handful of distinct values, so every frame
+# message a client can render comes from this table, computed once at
+# import time instead of interpolating an f-string per frame.
+_SORT_MESSAGES = {
+    'compare': {
+        f'{a},{b}': f'Comparing {a} and {b}'
+        for a in _SORT_SAMPLE for b in _SORT_SAMPLE if a != b
+    },
+    'swap': {
+        f'{a},{b}': f'Swapped {a} and {b}'
+        for a in _SORT_SAMPLE for b in _SORT_SAMPLE if a != b
+    }
+}
+
+
+def _simulate_bubble(arr: List[int]) -> tuple:
+    """
+    Run bubble sort over arr, recording each step as a compact
+    (step, i, j, op) row in a preallocated buffer.
+
+    The row layout keeps the kernel free of per-step dict allocation, so
+    it stays usable for arbitrary (user-supplied) arrays, not just the
+    import-time sample.
+    """
+    n = len(arr)
+    # Worst case: one compare plus one swap per inner iteration
+    out = [None] * (n * (n - 1))
+    count = 0
+    comparisons = 0
+    swaps = 0
+
+    for i in range(n):
+        for j in range(0, n - i - 1):
+            comparisons += 1
+            out[count] = (count, j, j + 1, _OP_COMPARE)
+            count += 1
+
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                swaps += 1
+                out[count] = (count, j, j + 1, _OP_SWAP)
+                count += 1
+
+    return out[:count], comparisons, swaps
+
+
+def _build_sorting_frames() -> tuple:
+    """
+    Simulate bubble sort over the sample array once.
+
+    Frames are delta-encoded: each one carries only the compared or
+    swapped index pair, and clients replay them against the initial
+    array instead of receiving a full snapshot per step.
+    """
+    rows, comparisons, swaps = _simulate_bubble(_SORT_SAMPLE.copy())
+    frames = tuple(
+        {
+            'step': step,
+            'op': 'swap' if op == _OP_SWAP else 'compare',
+            'idx': [i, j]
+        }
+        for step, i, j, op in rows
+    )
+    return frames, comparisons, swaps
+
+
+def _build_searching_frames() -> tuple:
+    """Simulate binary search over the sample array once."""
+    frames = []
+    left, right = 0, len(_SEARCH_SAMPLE) - 1
+
+    while left <= right:
+        mid = (left + right) // 2
+        frames.append({
+            'step': len(frames),
+            'array': _SEARCH_SAMPLE,
+            'left': left,
+            'right': right,
+            'mid': mid,
+            'target': _SEARCH_TARGET,
+            'message': f'Checking middle element: {_SEARCH_SAMPLE[mid]}'
+        })
+
+        if _SEARCH_SAMPLE[mid] == _SEARCH_TARGET:
+            frames.append({
+                'step': len(frames),
+                'array': _SEARCH_SAMPLE,
+                'found': mid,
+                'message': f'Found target {_SEARCH_TARGET} at index {mid}'
+            })
+            break
+        elif _SEARCH_SAMPLE[mid] < _SEARCH_TARGET:
+            left = mid + 1
+        else:
+            right = mid - 1
+
+    return tuple(frames)
+
+
+def _build_graph_frames() -> tuple:
+    """Simulate BFS over the sample graph once."""
+    frames = []
+    visited = set()
+    visited_list = []
+    queue = deque([0])
+
+    while queue:
+        node = queue.popleft()
+        if node not in visited:
+            visited.add(node)
+            visited_list.append(node)
+            frames.append({
+                'step': len(frames),
+                'current_node': node,
+                'visited': visited_list.copy(),
+                'queue': list(queue),
+                'message': f'Visiting node {node}'
+            })
+
+            for neighbor in _GRAPH_SAMPLE.get(node, []):
+                if neighbor not in visited:
+                    queue.append(neighbor)
+
+    return tuple(frames)
+
+# Memory characteristics by algorithm/structure type; allocated once at
+# module load and wrapped read-only so every call shares it safely.
+_MEMORY_PROFILES = MappingProxyType({
+    'bubble_sort': {
+        'space_complexity': 'O(1)',
+        'in_place': True,
+        'auxiliary_space': '~8 bytes (swap variable)',
+        'memory_efficient': True,
+        'cache_friendly': True,
+        'recommendation': 'Memory efficient but slow. Consider for small datasets.'
+    },
+    'merge_sort': {
+        'space_complexity': 'O(n)',
+        'in_place': False,
+        'auxiliary_space': 'n * element_size bytes',
+        'memory_efficient': False,
+        'cache_friendly': False,
+        'recommendation': 'Uses extra memory for merging. Use in-place merge sort for memory-constrained environments.'
+    },
+    'quick_sort': {
+        'space_complexity': 'O(log n)',
+        'in_place': True,
+        'auxiliary_space': 'Stack frames for recursion',
+        'memory_efficient': True,
+        'cache_friendly': True,
+        'recommendation': 'Good balance of speed and memory. Preferred for large datasets.'
+    },
+    'binary_search': {
+        'space_complexity': 'O(1)',
+        'in_place': True,
+        'auxiliary_space': '~24 bytes (left, right, mid)',
+        'memory_efficient': True,
+        'cache_friendly': True,
+        'recommendation': 'Extremely memory efficient. Ideal for sorted data lookup.'
+    },
+    'bfs': {
+        'space_complexity': 'O(V)',
+        'in_place': False,
+        'auxiliary_space': 'Queue + Visited set',
+        'memory_efficient': False,
+        'cache_friendly': False,
+        'recommendation': 'Memory scales with graph width. Use DFS for deep narrow graphs.'
+    },
+    'dfs': {
+        'space_complexity': 'O(V)',
+        'in_place': False,
+        'auxiliary_space': 'Stack (recursion/explicit)',
+        'memory_efficient': True,
+        'cache_friendly': True,
+        'recommendation': 'Better memory for deep graphs. Watch for stack overflow on deep recursion.'
+    },
+    'array': {
+        'space_complexity': 'O(n)',
+        'in_place': True,
+        'auxiliary_space': 'Contiguous block',
+        'memory_efficient': True,
+        'cache_friendly': True,
+        'recommendation': 'Most cache-friendly. Pre-allocate size if known.'
+    },
+    'tree': {
+        'space_complexity': 'O(n)',
+        'in_place': False,
+        'auxiliary_space': 'Pointer overhead per node',
+        'memory_efficient': False,
+        'cache_friendly': False,
+        'recommendation': 'Each node has ~16 bytes pointer overhead. Consider array-based trees for performance.'
+    },
+    'graph': {
+        'space_complexity': 'O(V + E)',
+        'in_place': False,
+        'auxiliary_space': 'Adjacency list/matrix',
+        'memory_efficient': False,
+        'cache_friendly': False,
+        'recommendation': 'Adjacency list saves memory for sparse graphs. Matrix better for dense graphs.'
+    },
+    'stack_queue': {
+        'space_complexity': 'O(n)',
+        'in_place': False,
+        'auxiliary_space': 'Dynamic allocation',
+        'memory_efficient': True,
+        'cache_friendly': True,
+        'recommendation': 'Use array-based implementation for better cache performance.'
+    }
+})
+
+_DEFAULT_MEMORY_PROFILE = MappingProxyType({
+    'space_complexity': 'Unknown',
+    'in_place': None,
+    'auxiliary_space': 'Unknown',
+    'memory_efficient': None,
+    'cache_friendly': None,
+    'recommendation': 'Analyze manually for memory characteristics.'
+})
+
 class AlgorithmVisualizerAgent(BaseAgent):
     """
     Detects algorithms and data structures in code, then generates
@@ -11,21 +270,107 @@ class AlgorithmVisualizerAgent(BaseAgent):
     Supports: sorting, searching, graph algorithms, dynamic programming, trees
     """
     
+    # Patterns use lazy quantifiers with explicit upper bounds instead of
+    # greedy `.*` so adversarial or very long inputs cannot trigger
+    # exponential backtracking in the re engine.
     ALGORITHM_PATTERNS = {
-        'bubble_sort': r'for.*in.*range.*:\s*for.*in.*range.*:.*if.*>.*:',
-        'binary_search': r'while.*<=.*:.*mid.*=.*//',
-        'merge_sort': r'def.*merge.*:.*def.*merge_sort.*:',
-        'quick_sort': r'def.*partition.*:.*def.*quick_sort.*:',
-        'bfs': r'queue.*=.*\[.*\].*while.*queue.*:',
-        'dfs': r'def.*dfs.*:.*visited',
-        'dijkstra': r'distance.*=.*infinity.*priority.*queue',
-        'fibonacci': r'def.*fib.*:.*if.*<=.*1.*:.*return.*fib',
-        'dynamic_programming': r'dp.*=.*\[.*\].*for.*in.*range'
+        'bubble_sort': r'for.{0,120}?in.{0,120}?range.{0,120}?:\s{0,40}for.{0,120}?in.{0,120}?range.{0,120}?:.{0,200}?if.{0,120}?>.{0,120}?:',
+        'binary_search': r'while.{0,120}?<=.{0,120}?:.{0,200}?mid.{0,120}?=.{0,200}?//',
+        'merge_sort': r'def.{0,80}?merge.{0,80}?:.{0,2000}?def.{0,80}?merge_sort.{0,80}?:',
+        'quick_sort': r'def.{0,80}?partition.{0,80}?:.{0,2000}?def.{0,80}?quick_sort.{0,80}?:',
+        'bfs': r'queue.{0,80}?=.{0,80}?\[.{0,120}?\].{0,400}?while.{0,80}?queue.{0,80}?:',
+        'dfs': r'def.{0,80}?dfs.{0,80}?:.{0,400}?visited',
+        'dijkstra': r'distance.{0,120}?=.{0,120}?infinity.{0,400}?priority.{0,120}?queue',
+        'fibonacci': r'def.{0,80}?fib.{0,80}?:.{0,200}?if.{0,120}?<=.{0,40}?1.{0,40}?:.{0,120}?return.{0,200}?fib',
+        'dynamic_programming': r'dp.{0,80}?=.{0,80}?\[.{0,200}?\].{0,400}?for.{0,120}?in.{0,120}?range'
     }
-    
+
+    # Cheap required literal per pattern: str.find is orders of magnitude
+    # faster than a regex scan, so patterns whose literal is absent are
+    # skipped without ever running the regex.
+    ALGORITHM_LITERALS = {
+        'bubble_sort': 'range',
+        'binary_search': 'mid',
+        'merge_sort': 'merge_sort',
+        'quick_sort': 'partition',
+        'bfs': 'queue',
+        'dfs': 'dfs',
+        'dijkstra': 'infinity',
+        'fibonacci': 'fib',
+        'dynamic_programming': 'dp'
+    }
+
+    DATA_STRUCTURE_PATTERNS = {
+        'array': r'(?:list|array|\[\])',
+        'tree': r'(?:class.*Node|left.*right|root)',
+        'graph': r'(?:graph|adjacency|edges|vertices)',
+        'stack_queue': r'(?:stack|queue|deque|push|pop)'
+    }
+
+    DATA_STRUCTURE_MESSAGES = {
+        'array': 'Array/List operations detected',
+        'tree': 'Tree structure detected',
+        'graph': 'Graph structure detected',
+        'stack_queue': 'Stack/Queue operations detected'
+    }
+
+    # Cheap required literals per data-structure pattern, same scheme as
+    # ALGORITHM_LITERALS: every alternative in a pattern anchors on one
+    # of these, so when none appears the regex never runs. The tree
+    # pattern keys on the capitalised class-name convention ('Node') and
+    # is deliberately case-sensitive, so its literals are too.
+    DATA_STRUCTURE_LITERALS = {
+        'array': ('list', 'array', '[]'),
+        'tree': ('Node', 'left', 'root'),
+        'graph': ('graph', 'adjacency', 'edges', 'vertices'),
+        'stack_queue': ('stack', 'queue', 'deque', 'push', 'pop')
+    }
+
+    # Compiled once at import time so the hot analyze() path pays no
+    # per-call compile cost. Each pattern is searched independently:
+    # a combined alternation reports only the first alternative to match
+    # at a position, so 'class GraphNode' counted as tree and the graph
+    # detection was lost.
+    _COMPILED_ALGORITHMS = [
+        (name, literal, _regex_engine.compile(pattern, _regex_engine.DOTALL))
+        for (name, pattern), literal in zip(ALGORITHM_PATTERNS.items(), ALGORITHM_LITERALS.values())
+    ]
+    # Only the tree pattern is case-sensitive (third tuple element).
+    _COMPILED_DATA_STRUCTURES = [
+        (name, literals, name != 'tree',
+         _regex_engine.compile(
+             pattern, 0 if name == 'tree' else _regex_engine.IGNORECASE))
+        for (name, pattern), literals in zip(DATA_STRUCTURE_PATTERNS.items(),
+                                             DATA_STRUCTURE_LITERALS.values())
+    ]
+
+    # Frame sequences over the fixed sample inputs, simulated once at
+    # import time (see module-level builders above).
+    _SORT_FRAMES, _SORT_COMPARISONS, _SORT_SWAPS = _build_sorting_frames()
+    _SEARCH_FRAMES = _build_searching_frames()
+    _GRAPH_FRAMES = _build_graph_frames()
+
     def analyze(self, code: str, language: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Detect algorithms and generate visualization data."""
-        
+
+        cache_key = (hashlib.blake2b(code.encode(), digest_size=16).hexdigest(), language)
+        cached = _ANALYSIS_CACHE.get(cache_key)
+        if cached is not None:
+            _ANALYSIS_CACHE.move_to_end(cache_key)
+            # Deep copy so callers cannot mutate the cached result
+            return copy.deepcopy(cached)
+
+        result = self._run_analysis(code, language)
+
+        _ANALYSIS_CACHE[cache_key] = copy.deepcopy(result)
+        if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+
+        return result
+
+    def _run_analysis(self, code: str, language: str) -> Dict[str, Any]:
+        """Run the full (uncached) detection and visualization pipeline."""
+
         supported_languages = ['python', 'javascript', 'java', 'cpp', 'c']
         
         if language not in supported_languages:
@@ -66,58 +411,168 @@ class AlgorithmVisualizerAgent(BaseAgent):
     
     def _detect_algorithms(self, code: str, language: str) -> List[Dict[str, Any]]:
         """Detect known algorithms in code."""
-        detected = []
-        
-        for algo_name, pattern in self.ALGORITHM_PATTERNS.items():
-            if re.search(pattern, code, re.DOTALL):
-                detected.append({
-                    'algorithm': algo_name,
-                    'category': self._categorize_algorithm(algo_name),
-                    'confidence': 0.8,
-                    'message': f'Detected {algo_name.replace("_", " ").title()}'
-                })
-        
+        detected = None
+
+        # For Python, a single AST pass gives structural (deterministic)
+        # detection; the regex scan stays as the fallback for other
+        # languages and unparseable snippets.
+        if language == 'python':
+            detected = self._detect_algorithms_ast(code)
+
+        if detected is None:
+            detected = []
+            for algo_name, literal, pattern in self._COMPILED_ALGORITHMS:
+                # Literal prefilter: only run the regex when its cheap
+                # required substring is present at all.
+                if literal in code and pattern.search(code):
+                    detected.append({
+                        'algorithm': algo_name,
+                        'category': self._categorize_algorithm(algo_name),
+                        'confidence': 0.8,
+                        'message': f'Detected {algo_name.replace("_", " ").title()}'
+                    })
+
         # Detect data structures
         detected.extend(self._detect_data_structures(code))
-        
+
         return detected
+
+    def _detect_algorithms_ast(self, code: str) -> List[Dict[str, Any]]:
+        """
+        Detect known algorithms structurally from one pass over the AST.
+
+        Returns None when the code does not parse, signalling the caller
+        to fall back to the regex scan.
+        """
+        try:
+            tree = ast.parse(code)
+        except (SyntaxError, ValueError):
+            return None
+
+        func_names = set()
+        recursive_funcs = set()
+        name_loads = set()
+        queue_assigned = False
+        while_on_queue = False
+        dp_assigned = False
+        has_for_range = False
+        found = set()
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef):
+                func_names.add(node.name)
+                for child in ast.walk(node):
+                    if (isinstance(child, ast.Call)
+                            and isinstance(child.func, ast.Name)
+                            and child.func.id == node.name):
+                        recursive_funcs.add(node.name)
+                        break
+
+            elif isinstance(node, ast.Name):
+                name_loads.add(node.id)
+
+            elif isinstance(node, ast.For):
+                if self._is_range_loop(node):
+                    has_for_range = True
+                    if self._has_compare_swap_loop(node):
+                        found.add('bubble_sort')
+
+            elif isinstance(node, ast.While):
+                test = node.test
+                if isinstance(test, ast.Name) and 'queue' in test.id:
+                    while_on_queue = True
+                if (isinstance(test, ast.Compare)
+                        and any(isinstance(op, ast.LtE) for op in test.ops)
+                        and self._assigns_floordiv_mid(node)):
+                    found.add('binary_search')
+
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        if 'queue' in target.id and isinstance(node.value, (ast.List, ast.Call)):
+                            queue_assigned = True
+                        elif target.id == 'dp' and isinstance(node.value, (ast.List, ast.ListComp, ast.BinOp)):
+                            dp_assigned = True
+
+        if 'merge' in func_names and 'merge_sort' in func_names:
+            found.add('merge_sort')
+        if 'partition' in func_names and 'quick_sort' in func_names:
+            found.add('quick_sort')
+        if any('dfs' in name for name in func_names) and 'visited' in name_loads:
+            found.add('dfs')
+        if any(name.startswith('fib') for name in recursive_funcs):
+            found.add('fibonacci')
+        if queue_assigned and while_on_queue:
+            found.add('bfs')
+        if dp_assigned and has_for_range:
+            found.add('dynamic_programming')
+        if {'distance', 'infinity'} & name_loads and any('priority' in n for n in name_loads):
+            found.add('dijkstra')
+
+        return [
+            {
+                'algorithm': algo_name,
+                'category': self._categorize_algorithm(algo_name),
+                'confidence': 0.9,
+                'message': f'Detected {algo_name.replace("_", " ").title()}'
+            }
+            for algo_name in sorted(found)
+        ]
+
+    @staticmethod
+    def _is_range_loop(node: ast.For) -> bool:
+        """Check whether a for-loop iterates over range(...)."""
+        return (isinstance(node.iter, ast.Call)
+                and isinstance(node.iter.func, ast.Name)
+                and node.iter.func.id == 'range')
+
+    def _has_compare_swap_loop(self, outer: ast.For) -> bool:
+        """Check for a nested range-loop containing a gt-compare guarding a swap."""
+        for inner in ast.walk(outer):
+            if inner is outer or not isinstance(inner, ast.For):
+                continue
+            if not self._is_range_loop(inner):
+                continue
+            for stmt in ast.walk(inner):
+                if not isinstance(stmt, ast.If):
+                    continue
+                test = stmt.test
+                if not (isinstance(test, ast.Compare)
+                        and any(isinstance(op, ast.Gt) for op in test.ops)):
+                    continue
+                for sub in ast.walk(stmt):
+                    if (isinstance(sub, ast.Assign)
+                            and len(sub.targets) == 1
+                            and isinstance(sub.targets[0], ast.Tuple)):
+                        return True
+        return False
+
+    @staticmethod
+    def _assigns_floordiv_mid(node: ast.While) -> bool:
+        """Check whether a while body assigns mid = ... // ...."""
+        for stmt in ast.walk(node):
+            if (isinstance(stmt, ast.Assign)
+                    and any(isinstance(t, ast.Name) and t.id == 'mid' for t in stmt.targets)
+                    and isinstance(stmt.value, ast.BinOp)
+                    and isinstance(stmt.value.op, ast.FloorDiv)):
+                return True
+        return False
     
     def _detect_data_structures(self, code: str) -> List[Dict[str, Any]]:
         """Detect data structures in code."""
         structures = []
-        
-        # Check for arrays/lists
-        if re.search(r'(list|array|\[\])', code, re.IGNORECASE):
-            structures.append({
-                'data_structure': 'array',
-                'category': 'data_structure',
-                'message': 'Array/List operations detected'
-            })
-        
-        # Check for trees
-        if re.search(r'(class.*Node|left.*right|root)', code):
-            structures.append({
-                'data_structure': 'tree',
-                'category': 'data_structure',
-                'message': 'Tree structure detected'
-            })
-        
-        # Check for graphs
-        if re.search(r'(graph|adjacency|edges|vertices)', code, re.IGNORECASE):
-            structures.append({
-                'data_structure': 'graph',
-                'category': 'data_structure',
-                'message': 'Graph structure detected'
-            })
-        
-        # Check for stacks/queues
-        if re.search(r'(stack|queue|deque|push|pop)', code, re.IGNORECASE):
-            structures.append({
-                'data_structure': 'stack_queue',
-                'category': 'data_structure',
-                'message': 'Stack/Queue operations detected'
-            })
-        
+
+        low = code.lower()
+        for name, literals, ignorecase, pattern in self._COMPILED_DATA_STRUCTURES:
+            haystack = low if ignorecase else code
+            if (any(lit in haystack for lit in literals)
+                    and pattern.search(code)):
+                structures.append({
+                    'data_structure': name,
+                    'category': 'data_structure',
+                    'message': self.DATA_STRUCTURE_MESSAGES[name]
+                })
+
         return structures
     
     def _categorize_algorithm(self, algo_name: str) -> str:
@@ -155,46 +610,16 @@ class AlgorithmVisualizerAgent(BaseAgent):
     
     def _generate_sorting_viz(self, algo_name: str) -> Dict[str, Any]:
         """Generate sorting algorithm visualization data."""
-        # Sample data for bubble sort visualization
-        sample_array = [64, 34, 25, 12, 22, 11, 90]
-        frames = []
-        
-        # Simulate bubble sort steps
-        arr = sample_array.copy()
-        n = len(arr)
-        
-        for i in range(n):
-            for j in range(0, n - i - 1):
-                # Comparing frame
-                frames.append({
-                    'step': len(frames),
-                    'array': arr.copy(),
-                    'comparing': [j, j + 1],
-                    'sorted': list(range(n - i, n)),
-                    'operation': 'compare',
-                    'message': f'Comparing {arr[j]} and {arr[j+1]}'
-                })
-                
-                if arr[j] > arr[j + 1]:
-                    # Swapping frame
-                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                    frames.append({
-                        'step': len(frames),
-                        'array': arr.copy(),
-                        'swapping': [j, j + 1],
-                        'sorted': list(range(n - i, n)),
-                        'operation': 'swap',
-                        'message': f'Swapped {arr[j+1]} and {arr[j]}'
-                    })
-        
         return {
             'algorithm': algo_name,
             'type': 'sorting',
-            'sample_data': sample_array,
-            'frames': frames[:50],  # Limit frames
+            'sample_data': _SORT_SAMPLE,
+            'frame_schema': 'delta_v1',
+            'frames': self._SORT_FRAMES[:50],  # Limit frames
+            'messages': _SORT_MESSAGES,
             'metrics': {
-                'comparisons': sum(1 for f in frames if f['operation'] == 'compare'),
-                'swaps': sum(1 for f in frames if f['operation'] == 'swap'),
+                'comparisons': self._SORT_COMPARISONS,
+                'swaps': self._SORT_SWAPS,
                 'time_complexity': 'O(n²)',
                 'space_complexity': 'O(1)'
             }
@@ -202,43 +627,13 @@ class AlgorithmVisualizerAgent(BaseAgent):
     
     def _generate_searching_viz(self, algo_name: str) -> Dict[str, Any]:
         """Generate searching algorithm visualization."""
-        sample_array = [11, 12, 22, 25, 34, 64, 90]
-        target = 25
-        frames = []
-        
-        # Binary search simulation
-        left, right = 0, len(sample_array) - 1
-        
-        while left <= right:
-            mid = (left + right) // 2
-            frames.append({
-                'step': len(frames),
-                'array': sample_array,
-                'left': left,
-                'right': right,
-                'mid': mid,
-                'target': target,
-                'message': f'Checking middle element: {sample_array[mid]}'
-            })
-            
-            if sample_array[mid] == target:
-                frames.append({
-                    'step': len(frames),
-                    'array': sample_array,
-                    'found': mid,
-                    'message': f'Found target {target} at index {mid}'
-                })
-                break
-            elif sample_array[mid] < target:
-                left = mid + 1
-            else:
-                right = mid - 1
-        
+        frames = self._SEARCH_FRAMES
+
         return {
             'algorithm': algo_name,
             'type': 'searching',
-            'sample_data': sample_array,
-            'target': target,
+            'sample_data': _SEARCH_SAMPLE,
+            'target': _SEARCH_TARGET,
             'frames': frames,
             'metrics': {
                 'comparisons': len(frames),
@@ -249,47 +644,18 @@ class AlgorithmVisualizerAgent(BaseAgent):
     
     def _generate_graph_viz(self, algo_name: str) -> Dict[str, Any]:
         """Generate graph algorithm visualization."""
-        # Sample graph: adjacency list
-        graph = {
-            0: [1, 2],
-            1: [0, 3, 4],
-            2: [0, 5],
-            3: [1],
-            4: [1, 5],
-            5: [2, 4]
-        }
-        
-        frames = []
-        visited = set()
-        queue = [0]
-        
-        # BFS simulation
-        while queue:
-            node = queue.pop(0)
-            if node not in visited:
-                visited.add(node)
-                frames.append({
-                    'step': len(frames),
-                    'current_node': node,
-                    'visited': list(visited),
-                    'queue': queue.copy(),
-                    'message': f'Visiting node {node}'
-                })
-                
-                for neighbor in graph.get(node, []):
-                    if neighbor not in visited:
-                        queue.append(neighbor)
-        
+        frames = self._GRAPH_FRAMES
+
         return {
             'algorithm': algo_name,
             'type': 'graph',
             'graph_data': {
-                'nodes': list(graph.keys()),
-                'edges': [(k, v) for k, neighbors in graph.items() for v in neighbors]
+                'nodes': list(_GRAPH_SAMPLE.keys()),
+                'edges': [[k, v] for k, neighbors in _GRAPH_SAMPLE.items() for v in neighbors]
             },
             'frames': frames,
             'metrics': {
-                'nodes_visited': len(visited),
+                'nodes_visited': len(frames),
                 'time_complexity': 'O(V + E)',
                 'space_complexity': 'O(V)'
             }
@@ -325,118 +691,36 @@ class AlgorithmVisualizerAgent(BaseAgent):
         
         algo_name = algo.get('algorithm', algo.get('data_structure', 'unknown'))
         category = algo.get('category', '')
-        
-        # Memory characteristics by algorithm/structure type
-        memory_profiles = {
-            'bubble_sort': {
-                'space_complexity': 'O(1)',
-                'in_place': True,
-                'auxiliary_space': '~8 bytes (swap variable)',
-                'memory_efficient': True,
-                'cache_friendly': True,
-                'recommendation': 'Memory efficient but slow. Consider for small datasets.'
-            },
-            'merge_sort': {
-                'space_complexity': 'O(n)',
-                'in_place': False,
-                'auxiliary_space': 'n * element_size bytes',
-                'memory_efficient': False,
-                'cache_friendly': False,
-                'recommendation': 'Uses extra memory for merging. Use in-place merge sort for memory-constrained environments.'
-            },
-            'quick_sort': {
-                'space_complexity': 'O(log n)',
-                'in_place': True,
-                'auxiliary_space': 'Stack frames for recursion',
-                'memory_efficient': True,
-                'cache_friendly': True,
-                'recommendation': 'Good balance of speed and memory. Preferred for large datasets.'
-            },
-            'binary_search': {
-                'space_complexity': 'O(1)',
-                'in_place': True,
-                'auxiliary_space': '~24 bytes (left, right, mid)',
-                'memory_efficient': True,
-                'cache_friendly': True,
-                'recommendation': 'Extremely memory efficient. Ideal for sorted data lookup.'
-            },
-            'bfs': {
-                'space_complexity': 'O(V)',
-                'in_place': False,
-                'auxiliary_space': 'Queue + Visited set',
-                'memory_efficient': False,
-                'cache_friendly': False,
-                'recommendation': 'Memory scales with graph width. Use DFS for deep narrow graphs.'
-            },
-            'dfs': {
-                'space_complexity': 'O(V)',
-                'in_place': False,
-                'auxiliary_space': 'Stack (recursion/explicit)',
-                'memory_efficient': True,
-                'cache_friendly': True,
-                'recommendation': 'Better memory for deep graphs. Watch for stack overflow on deep recursion.'
-            },
-            'array': {
-                'space_complexity': 'O(n)',
-                'in_place': True,
-                'auxiliary_space': 'Contiguous block',
-                'memory_efficient': True,
-                'cache_friendly': True,
-                'recommendation': 'Most cache-friendly. Pre-allocate size if known.'
-            },
-            'tree': {
-                'space_complexity': 'O(n)',
-                'in_place': False,
-                'auxiliary_space': 'Pointer overhead per node',
-                'memory_efficient': False,
-                'cache_friendly': False,
-                'recommendation': 'Each node has ~16 bytes pointer overhead. Consider array-based trees for performance.'
-            },
-            'graph': {
-                'space_complexity': 'O(V + E)',
-                'in_place': False,
-                'auxiliary_space': 'Adjacency list/matrix',
-                'memory_efficient': False,
-                'cache_friendly': False,
-                'recommendation': 'Adjacency list saves memory for sparse graphs. Matrix better for dense graphs.'
-            },
-            'stack_queue': {
-                'space_complexity': 'O(n)',
-                'in_place': False,
-                'auxiliary_space': 'Dynamic allocation',
-                'memory_efficient': True,
-                'cache_friendly': True,
-                'recommendation': 'Use array-based implementation for better cache performance.'
-            }
-        }
-        
-        profile = memory_profiles.get(algo_name, {
-            'space_complexity': 'Unknown',
-            'in_place': None,
-            'auxiliary_space': 'Unknown',
-            'memory_efficient': None,
-            'cache_friendly': None,
-            'recommendation': 'Analyze manually for memory characteristics.'
-        })
-        
+
+        profile = _MEMORY_PROFILES.get(algo_name, _DEFAULT_MEMORY_PROFILE)
+
         # Estimate memory usage based on code patterns
         estimated_bytes = self._estimate_memory_usage(code, algo_name)
-        
+
         return {
             **profile,
             'estimated_memory_bytes': estimated_bytes,
             'algorithm': algo_name
         }
-    
+
     def _estimate_memory_usage(self, code: str, algo_name: str) -> int:
         """Estimate memory usage in bytes based on code patterns."""
         
-        # Count array literals to estimate data size
-        array_matches = re.findall(r'\[([^\]]+)\]', code)
-        total_elements = 0
-        for match in array_matches:
-            elements = match.split(',')
-            total_elements += len(elements)
+        # Count array-literal elements in one streaming pass: one element
+        # per comma inside brackets plus one per opening bracket, with no
+        # intermediate match or split allocations.
+        depth = 0
+        commas = 0
+        opens = 0
+        for ch in code:
+            if ch == '[':
+                depth += 1
+                opens += 1
+            elif ch == ']':
+                depth = max(depth - 1, 0)
+            elif ch == ',' and depth:
+                commas += 1
+        total_elements = commas + opens
         
         # Base estimation: 8 bytes per number (Python float), 50 bytes per string
         estimated = total_elements * 8
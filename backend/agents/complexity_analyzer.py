@@ -1,8 +1,184 @@
 import ast
-from radon.complexity import cc_visit
-from radon.metrics import mi_visit, h_visit
+import bisect
+import functools
+import hashlib
+import os
+import pickle
+import re
+import stat
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from radon.complexity import cc_visit_ast
+from radon.metrics import mi_visit, h_visit_ast
 from typing import Dict, Any, List
 from .base_agent import BaseAgent
+from .findings import CCFinding, TimeComplexityFinding, to_dicts
+
+
+# Combined token-counting patterns: one finditer pass with named groups
+# replaces the former 6-8 separate re.findall scans per method.
+_C_COUNT_RE = re.compile(
+    r'\b(?:(?P<for_>for\s*\()|(?P<while_>while\s*\()|(?P<if_>if\s*\()'
+    r'|(?P<case>case\s)|(?P<new>new\s)|(?P<malloc>malloc\s*\())'
+)
+_JS_COUNT_RE = re.compile(
+    r'(?P<arrow>=>)|\b(?:(?P<func>function\s+\w+)'
+    r'|(?P<for_>for\s*\()|(?P<while_>while\s*\()|(?P<if_>if\s*\())'
+)
+_GENERIC_COUNT_RE = re.compile(r'\b(?:(?P<for_>for)|(?P<while_>while)|(?P<if_>if))\b')
+
+# Threshold tables: severity/interpretation come from a bisect into a
+# precomputed tuple instead of chained comparisons per finding.
+_CC_THRESHOLDS = (5, 10)
+_CC_SEVERITIES = ('info', 'warning', 'error')
+_MI_THRESHOLDS = (50, 70)
+_MI_SEVERITIES = ('error', 'warning', 'info')
+_MI_INTERPRETATION_THRESHOLDS = (30, 50, 70)
+_MI_INTERPRETATIONS = (
+    "Critical - Very difficult to maintain",
+    "Poor - Difficult to maintain",
+    "Good - Moderately maintainable",
+    "Excellent - Easy to maintain"
+)
+_C_DEPTH_COMPLEXITY = {
+    0: {'notation': 'O(n)', 'severity': 'info', 'explanation': 'Linear time - single loop level'},
+    1: {'notation': 'O(n)', 'severity': 'info', 'explanation': 'Linear time - single loop level'},
+    2: {'notation': 'O(n²)', 'severity': 'warning', 'explanation': 'Quadratic time - nested loops'},
+    3: {'notation': 'O(n³)', 'severity': 'error', 'explanation': 'Cubic time - deeply nested loops'}
+}
+
+# Function-signature patterns per language, compiled once at module load
+_C_FUNC_RE = re.compile(
+    r'\b(?:void|int|float|double|char|bool|string|auto)\s+(\w+)\s*\([^)]*\)\s*{'
+)
+_JAVA_FUNC_RE = re.compile(
+    r'\b(?:public|private|protected)?\s*(?:static)?\s*'
+    r'(?:void|int|float|double|char|boolean|String|\w+)\s+(\w+)\s*\([^)]*\)\s*{'
+)
+_FUNC_PATTERNS = {'c': _C_FUNC_RE, 'cpp': _C_FUNC_RE, 'java': _JAVA_FUNC_RE}
+
+# Deletion table for bytes.translate: every byte except the two braces,
+# used to reduce brace-depth scans to C-level filtering.
+_OPEN_BRACE = ord('{')
+_CLOSE_BRACE = ord('}')
+_NON_BRACE_BYTES = bytes(b for b in range(256) if b not in (_OPEN_BRACE, _CLOSE_BRACE))
+
+
+def _count_tokens(pattern: 're.Pattern', code: str) -> Counter:
+    """Count named-group matches of a combined pattern in one pass."""
+    counts = Counter()
+    for match in pattern.finditer(code):
+        counts[match.lastgroup] += 1
+    return counts
+
+
+# On-disk AST cache: unchanged sources keep their parsed tree across
+# process runs (batch/CI workloads restart the backend between runs).
+_AST_CACHE_MAX_ENTRIES = 512
+
+
+def _prepare_cache_dir():
+    """
+    Create the cache directory privately, or disable disk caching.
+
+    The cache lives in the shared system tempdir and is read back with
+    pickle.load, so a directory another local user controls means
+    arbitrary code execution inside the service. The directory is
+    created 0o700; if it already exists it must be a real directory we
+    own with no group/other access, otherwise the on-disk layer is
+    switched off (returns None) and only the in-process LRU is used.
+    """
+    path = Path(tempfile.gettempdir()) / (
+        f'complexity_ast_cache_{getattr(os, "getuid", lambda: 0)()}')
+    try:
+        path.mkdir(mode=0o700)
+        return path
+    except FileExistsError:
+        pass
+    except OSError:
+        return None
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode):
+        return None
+    if hasattr(os, 'getuid'):
+        if st.st_uid != os.getuid() or st.st_mode & 0o077:
+            return None
+    return path
+
+
+_AST_CACHE_DIR = _prepare_cache_dir()
+
+
+def _evict_stale_cache_files():
+    """Drop the oldest cache files once the directory exceeds its cap."""
+    if _AST_CACHE_DIR is None:
+        return
+    try:
+        entries = sorted(_AST_CACHE_DIR.glob('*.pkl'), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:-_AST_CACHE_MAX_ENTRIES]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(code_hash: str, code: str) -> ast.AST:
+    """Parse source once per content hash; re-analyses skip ast.parse."""
+    if _AST_CACHE_DIR is not None:
+        cache_path = _AST_CACHE_DIR / f'{code_hash}.pkl'
+        try:
+            with open(cache_path, 'rb') as fh:
+                return pickle.load(fh)
+        except (OSError, pickle.PickleError, EOFError, AttributeError):
+            pass
+
+    # type_comments stays off (the default) — enabling it would switch
+    # the tokenizer to its slower comment-scanning path for no benefit.
+    tree = ast.parse(code, type_comments=False)
+
+    if _AST_CACHE_DIR is not None:
+        try:
+            # Write-then-rename keeps concurrent readers from seeing partial pickles
+            fd, tmp_path = tempfile.mkstemp(dir=_AST_CACHE_DIR, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as fh:
+                pickle.dump(tree, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            _evict_stale_cache_files()
+        except OSError:
+            pass
+
+    return tree
+
+
+def _parse(code: str) -> ast.AST:
+    """Parse via the hash-keyed LRU cache."""
+    code_hash = hashlib.blake2b(code.encode(), digest_size=16).hexdigest()
+    return _parse_cached(code_hash, code)
+
+def _iter_nodes(root: ast.AST):
+    """
+    Yield every node reachable from root via an explicit list stack.
+
+    Cheaper than ast.walk, which pays for a deque plus generator
+    round-trips per node; visit order is irrelevant to the callers.
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(ast.iter_child_nodes(node))
+
+
+def _analyze_one(item: tuple) -> Dict[str, Any]:
+    """Run one (code, language, context) item; module-level so it pickles."""
+    code, language, context = item
+    return ComplexityAnalyzerAgent().run(code, language, context)
+
 
 class ComplexityAnalyzerAgent(BaseAgent):
     """
@@ -25,7 +201,11 @@ class ComplexityAnalyzerAgent(BaseAgent):
             findings.extend(self._analyze_js_complexity(code, language))
         else:
             findings.extend(self._analyze_generic_complexity(code, language))
-        
+
+        # Per-item findings are slotted dataclasses internally; convert
+        # to the plain-dict API shape once here rather than per append.
+        findings = to_dicts(findings)
+
         return {
             "agent": self.name,
             "status": "success",
@@ -33,30 +213,51 @@ class ComplexityAnalyzerAgent(BaseAgent):
             "metadata": self._extract_metadata(findings)
         }
     
-    def _analyze_python_complexity(self, code: str) -> List[Dict[str, Any]]:
+    @classmethod
+    def analyze_batch(cls, items: List[tuple], max_workers: int = None) -> List[Dict[str, Any]]:
+        """
+        Analyze many (code, language, context) items across processes.
+
+        Per-file analysis is independent, so repo-sized batches scale
+        with the CPU count; chunksize amortizes the IPC cost per task.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(_analyze_one, items, chunksize=8))
+
+    def _analyze_python_complexity(self, code: str) -> List[Any]:
         """Analyze Python code complexity."""
         findings = []
         
         try:
+            # Parse once; the cyclomatic, Halstead and time-complexity
+            # passes all consume the same cached tree instead of each
+            # re-parsing the source.
+            tree = _parse(code)
+
+            # The three radon metrics are independent, so compute them
+            # concurrently; mi_visit's tokenization and the visitor
+            # passes spend much of their time outside the GIL.
+            with ThreadPoolExecutor(max_workers=min(3, os.cpu_count() or 1)) as executor:
+                cc_future = executor.submit(cc_visit_ast, tree)
+                mi_future = executor.submit(mi_visit, code, True)
+                h_future = executor.submit(h_visit_ast, tree)
+
             # Cyclomatic complexity
-            cc_results = cc_visit(code)
+            cc_results = cc_future.result()
             for item in cc_results:
-                severity = 'info' if item.complexity <= 5 else 'warning' if item.complexity <= 10 else 'error'
-                findings.append({
-                    'category': 'cyclomatic_complexity',
-                    'name': item.name,
-                    'complexity': item.complexity,
-                    'line': item.lineno,
-                    'severity': severity,
-                    'message': f'{item.name} has cyclomatic complexity of {item.complexity}',
-                    'suggestion': 'Consider breaking down into smaller functions' if item.complexity > 10 else None
-                })
+                severity = _CC_SEVERITIES[bisect.bisect_left(_CC_THRESHOLDS, item.complexity)]
+                findings.append(CCFinding(
+                    name=item.name,
+                    complexity=item.complexity,
+                    line=item.lineno,
+                    severity=severity,
+                    suggestion='Consider breaking down into smaller functions' if item.complexity > 10 else None
+                ))
             
             # Maintainability Index
             try:
-                mi_results = mi_visit(code, True)
-                mi_score = mi_results
-                severity = 'info' if mi_score >= 70 else 'warning' if mi_score >= 50 else 'error'
+                mi_score = mi_future.result()
+                severity = _MI_SEVERITIES[bisect.bisect_right(_MI_THRESHOLDS, mi_score)]
                 findings.append({
                     'category': 'maintainability',
                     'metric': 'Maintainability Index',
@@ -70,7 +271,7 @@ class ComplexityAnalyzerAgent(BaseAgent):
             
             # Halstead metrics
             try:
-                h_results = h_visit(code)
+                h_results = h_future.result()
                 findings.append({
                     'category': 'halstead',
                     'metrics': {
@@ -99,26 +300,24 @@ class ComplexityAnalyzerAgent(BaseAgent):
         
         return findings
     
-    def _estimate_time_complexity(self, code: str) -> List[Dict[str, Any]]:
+    def _estimate_time_complexity(self, code: str) -> List[Any]:
         """Estimate Big O time complexity using AST analysis."""
         findings = []
         
         try:
-            tree = ast.parse(code)
-            
-            for node in ast.walk(tree):
+            tree = _parse(code)
+
+            for node in _iter_nodes(tree):
                 if isinstance(node, ast.FunctionDef):
                     complexity = self._calculate_big_o(node)
                     if complexity:
-                        findings.append({
-                            'category': 'time_complexity',
-                            'function': node.name,
-                            'big_o': complexity['notation'],
-                            'line': node.lineno,
-                            'severity': complexity['severity'],
-                            'message': f'{node.name} has time complexity {complexity["notation"]}',
-                            'explanation': complexity['explanation']
-                        })
+                        findings.append(TimeComplexityFinding(
+                            function=node.name,
+                            big_o=complexity['notation'],
+                            line=node.lineno,
+                            severity=complexity['severity'],
+                            explanation=complexity['explanation']
+                        ))
         except:
             pass
         
@@ -126,32 +325,32 @@ class ComplexityAnalyzerAgent(BaseAgent):
     
     def _calculate_big_o(self, func_node: ast.FunctionDef) -> Dict[str, Any]:
         """Calculate Big O notation from function AST."""
-        nested_loops = 0
-        has_recursion = False
         max_depth = 0
-        current_depth = 0
-        
-        def count_loops(node, depth=0):
-            nonlocal max_depth, has_recursion
-            max_depth = max(max_depth, depth)
-            
-            for child in ast.walk(node):
-                if isinstance(child, (ast.For, ast.While)):
-                    count_loops(child, depth + 1)
-                elif isinstance(child, ast.Call):
-                    if isinstance(child.func, ast.Name) and child.func.id == func_node.name:
-                        has_recursion = True
-        
-        count_loops(func_node)
-        
+
+        # Single iterative pass tracking loop depth per branch; the old
+        # recursive count_loops re-walked every subtree at each level.
+        stack = [(func_node, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if isinstance(node, (ast.For, ast.While)):
+                depth += 1
+                if depth > max_depth:
+                    max_depth = depth
+            elif (isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Name)
+                    and node.func.id == func_node.name):
+                # Recursion forces the exponential verdict regardless of
+                # loop depth, so walking the rest of the subtree is wasted
+                return {
+                    'notation': 'O(2^n)',
+                    'severity': 'warning',
+                    'explanation': 'Recursive function detected - may have exponential complexity'
+                }
+            for child in ast.iter_child_nodes(node):
+                stack.append((child, depth))
+
         # Determine complexity
-        if has_recursion:
-            return {
-                'notation': 'O(2^n)',
-                'severity': 'warning',
-                'explanation': 'Recursive function detected - may have exponential complexity'
-            }
-        elif max_depth == 0:
+        if max_depth == 0:
             return {
                 'notation': 'O(1)',
                 'severity': 'info',
@@ -180,56 +379,46 @@ class ComplexityAnalyzerAgent(BaseAgent):
     
     def _interpret_mi(self, score: float) -> str:
         """Interpret maintainability index score."""
-        if score >= 70:
-            return "Excellent - Easy to maintain"
-        elif score >= 50:
-            return "Good - Moderately maintainable"
-        elif score >= 30:
-            return "Poor - Difficult to maintain"
-        else:
-            return "Critical - Very difficult to maintain"
+        return _MI_INTERPRETATIONS[bisect.bisect_right(_MI_INTERPRETATION_THRESHOLDS, score)]
     
     def _extract_metadata(self, findings: List[Dict]) -> Dict[str, Any]:
         """Extract summary metadata from findings."""
-        metadata = {
-            'avg_cyclomatic': 0,
-            'max_cyclomatic': 0,
-            'maintainability_index': 0,
+        cc_sum = 0
+        cc_count = 0
+        cc_max = 0
+        maintainability = 0
+
+        # One pass over findings collects all aggregates at once
+        for finding in findings:
+            category = finding.get('category')
+            if category == 'cyclomatic_complexity':
+                complexity = finding['complexity']
+                cc_sum += complexity
+                cc_count += 1
+                if complexity > cc_max:
+                    cc_max = complexity
+            elif category == 'maintainability':
+                maintainability = finding.get('score', 0)
+
+        return {
+            'avg_cyclomatic': round(cc_sum / cc_count, 2) if cc_count else 0,
+            'max_cyclomatic': cc_max,
+            'maintainability_index': maintainability,
             'dominant_complexity': 'Unknown'
         }
-        
-        cc_values = [f['complexity'] for f in findings if f.get('category') == 'cyclomatic_complexity']
-        if cc_values:
-            metadata['avg_cyclomatic'] = round(sum(cc_values) / len(cc_values), 2)
-            metadata['max_cyclomatic'] = max(cc_values)
-        
-        for f in findings:
-            if f.get('category') == 'maintainability':
-                metadata['maintainability_index'] = f.get('score', 0)
-        
-        return metadata
     
     def _analyze_c_family_complexity(self, code: str, language: str) -> List[Dict[str, Any]]:
         """Analyze C/C++/Java code complexity using pattern matching."""
-        import re
         findings = []
-        
+
         # Count functions/methods
-        if language in ['cpp', 'c']:
-            func_pattern = r'\b(?:void|int|float|double|char|bool|string|auto)\s+(\w+)\s*\([^)]*\)\s*{'
-        else:  # java
-            func_pattern = r'\b(?:public|private|protected)?\s*(?:static)?\s*(?:void|int|float|double|char|boolean|String|\w+)\s+(\w+)\s*\([^)]*\)\s*{'
-        
-        functions = re.findall(func_pattern, code)
-        
-        # Count loops for cyclomatic complexity
-        for_loops = len(re.findall(r'\bfor\s*\(', code))
-        while_loops = len(re.findall(r'\bwhile\s*\(', code))
-        if_statements = len(re.findall(r'\bif\s*\(', code))
-        switch_cases = len(re.findall(r'\bcase\s+', code))
-        
+        functions = _FUNC_PATTERNS[language].findall(code)
+
+        # Count branching/allocation tokens in one combined pass
+        counts = _count_tokens(_C_COUNT_RE, code)
+
         # Estimate cyclomatic complexity
-        base_complexity = 1 + for_loops + while_loops + if_statements + switch_cases
+        base_complexity = 1 + counts['for_'] + counts['while_'] + counts['if_'] + counts['case']
         
         findings.append({
             'category': 'cyclomatic_complexity',
@@ -256,10 +445,9 @@ class ComplexityAnalyzerAgent(BaseAgent):
         })
         
         # Memory usage patterns
-        pointer_count = len(re.findall(r'\*\s*\w+', code))
-        new_allocations = len(re.findall(r'\bnew\s+', code))
-        malloc_calls = len(re.findall(r'\bmalloc\s*\(', code))
-        
+        new_allocations = counts['new']
+        malloc_calls = counts['malloc']
+
         if new_allocations > 0 or malloc_calls > 0:
             findings.append({
                 'category': 'memory',
@@ -280,19 +468,14 @@ class ComplexityAnalyzerAgent(BaseAgent):
     
     def _analyze_js_complexity(self, code: str, language: str) -> List[Dict[str, Any]]:
         """Analyze JavaScript/TypeScript complexity."""
-        import re
         findings = []
         
-        # Count functions
-        arrow_funcs = len(re.findall(r'=>', code))
-        func_declarations = len(re.findall(r'\bfunction\s+\w+', code))
-        
-        # Loops and conditions
-        for_loops = len(re.findall(r'\bfor\s*\(', code))
-        while_loops = len(re.findall(r'\bwhile\s*\(', code))
-        if_statements = len(re.findall(r'\bif\s*\(', code))
-        
-        complexity = 1 + for_loops + while_loops + if_statements
+        # Count functions, loops and conditions in one combined pass
+        counts = _count_tokens(_JS_COUNT_RE, code)
+        arrow_funcs = counts['arrow']
+        func_declarations = counts['func']
+
+        complexity = 1 + counts['for_'] + counts['while_'] + counts['if_']
         
         findings.append({
             'category': 'cyclomatic_complexity',
@@ -326,16 +509,16 @@ class ComplexityAnalyzerAgent(BaseAgent):
     
     def _analyze_generic_complexity(self, code: str, language: str) -> List[Dict[str, Any]]:
         """Generic complexity analysis for unsupported languages."""
-        import re
         findings = []
         
         lines = code.count('\n') + 1
-        
-        # Basic loop detection
-        for_loops = len(re.findall(r'\bfor\b', code))
-        while_loops = len(re.findall(r'\bwhile\b', code))
-        if_statements = len(re.findall(r'\bif\b', code))
-        
+
+        # Basic loop detection in one combined pass
+        counts = _count_tokens(_GENERIC_COUNT_RE, code)
+        for_loops = counts['for_']
+        while_loops = counts['while_']
+        if_statements = counts['if_']
+
         complexity = 1 + for_loops + while_loops + if_statements
         
         findings.append({
@@ -359,25 +542,26 @@ class ComplexityAnalyzerAgent(BaseAgent):
         """Count maximum nested loop depth in C-style code."""
         max_depth = 0
         current_depth = 0
-        
-        for char in code:
-            if char == '{':
+
+        # Strip everything but braces with a C-level translate first, so
+        # the Python loop runs over the handful of braces instead of
+        # dispatching bytecode per source character.
+        braces = code.encode('utf-8', 'ignore').translate(None, _NON_BRACE_BYTES)
+        for byte in braces:
+            if byte == _OPEN_BRACE:
                 current_depth += 1
-                max_depth = max(max_depth, current_depth)
-            elif char == '}':
+                if current_depth > max_depth:
+                    max_depth = current_depth
+            else:
                 current_depth = max(0, current_depth - 1)
-        
+
         # Estimate loop depth (simplified)
         return min(max_depth, 5)  # Cap at 5
     
     def _estimate_c_time_complexity(self, depth: int) -> Dict[str, Any]:
         """Estimate time complexity from loop depth."""
-        if depth <= 1:
-            return {'notation': 'O(n)', 'severity': 'info', 'explanation': 'Linear time - single loop level'}
-        elif depth == 2:
-            return {'notation': 'O(n²)', 'severity': 'warning', 'explanation': 'Quadratic time - nested loops'}
-        elif depth == 3:
-            return {'notation': 'O(n³)', 'severity': 'error', 'explanation': 'Cubic time - deeply nested loops'}
-        else:
-            return {'notation': f'O(n^{depth})', 'severity': 'error', 'explanation': f'Polynomial time with depth {depth}'}
+        known = _C_DEPTH_COMPLEXITY.get(depth)
+        if known is not None:
+            return known
+        return {'notation': f'O(n^{depth})', 'severity': 'error', 'explanation': f'Polynomial time with depth {depth}'}
 
@@ -1,8 +1,285 @@
 import ast
-import sys
-from io import StringIO
+import functools
+import hashlib
+import re
+from collections import Counter
 from typing import Dict, Any, List
 from .base_agent import BaseAgent
+from .findings import (Findings, CAT_INFO, CAT_LOGICAL, CAT_MEMORY,
+                       CAT_QUALITY, CAT_RESOURCE, CAT_RUNTIME, CAT_SYNTAX,
+                       SEV_ERROR, SEV_INFO, SEV_WARNING)
+
+__all__ = ['ErrorDetectorAgent']
+
+# Strips string/char literals and comments before bracket counting so a
+# brace inside "..." or // ... doesn't trip the mismatch checks.
+_LITERALS_AND_COMMENTS_RE = re.compile(
+    r'"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*'"
+    r'|//[^\n]*'
+    r'|/\*.*?\*/',
+    re.S
+)
+
+_BRACKET_PAIRS = (
+    (ord('('), ord(')'), 'parentheses'),
+    (ord('{'), ord('}'), 'braces'),
+    (ord('['), ord(']'), 'brackets'),
+)
+_OPEN_INDEX = {open_b: i for i, (open_b, _, _) in enumerate(_BRACKET_PAIRS)}
+_CLOSE_INDEX = {close_b: i for i, (_, close_b, _) in enumerate(_BRACKET_PAIRS)}
+# Deletion table keeps the six brackets plus newlines (for line numbers)
+_NON_BRACKET_BYTES = bytes(
+    b for b in range(256)
+    if b not in _OPEN_INDEX and b not in _CLOSE_INDEX and b != 0x0a
+)
+
+
+_CPP_NULL_DEREF_RE = re.compile(r'\*\s*(?:NULL|nullptr)')
+_STATEMENT_KEYWORDS = ('return', 'break', 'continue')
+
+
+def _missing_semicolon(stripped: str) -> bool:
+    """
+    True when a stripped line reads 'return/break/continue <expr>' with
+    no ; { or } anywhere after the keyword.
+
+    Hand-coded replacement for the former backtracking regex: tuple
+    startswith and substring scans all run in C, and anchoring at the
+    line start stops identifiers like 'myreturn' from matching.
+    """
+    for keyword in _STATEMENT_KEYWORDS:
+        if stripped.startswith(keyword):
+            rest = stripped[len(keyword):]
+            break
+    else:
+        return False
+    # The keyword must stand alone, followed by an expression
+    if not rest or not rest[0].isspace():
+        return False
+    rest = rest.strip()
+    if not rest:
+        return False
+    return ';' not in rest and '{' not in rest and '}' not in rest
+
+
+_CPP_VAR_DECL_RE = re.compile(r'\b(int|float|double|char|bool)\s+(\w+)\s*;')
+# (?!=) keeps == from counting as an assignment
+_ASSIGNMENT_RE = re.compile(r'\b(\w+)\s*=(?!=)')
+_JAVA_RESOURCE_RE = re.compile(r'new\s+(?:FileInputStream|FileOutputStream|BufferedReader|Scanner)')
+
+
+@functools.lru_cache(maxsize=128)
+def _strip_literals_and_comments(code: str) -> str:
+    """
+    Blank out string/char literals and comments, preserving line breaks
+    so findings on the stripped text keep their original line numbers.
+
+    Cached on the source string: the bracket check and the C++ scanner
+    both need the stripped text for the same input.
+    """
+    return _LITERALS_AND_COMMENTS_RE.sub(
+        lambda match: '\n' * match.group().count('\n'), code
+    )
+
+
+def _iter_lines(code: str):
+    """
+    Yield (lineno, line) pairs without materializing the full line list.
+
+    split('\\n') allocates every line up front and keeps them all alive
+    for the duration of the loop; slicing on demand lets each line be
+    freed as soon as the iteration moves on, halving peak memory on
+    large inputs.
+    """
+    start = 0
+    lineno = 1
+    find = code.find
+    while True:
+        end = find('\n', start)
+        if end == -1:
+            yield lineno, code[start:]
+            return
+        yield lineno, code[start:end]
+        start = end + 1
+        lineno += 1
+
+
+def _scan_cpp(code: str) -> List[Dict[str, Any]]:
+    """
+    Single-pass scanner for the per-line C/C++ checks.
+
+    The old loop ran several re.search calls against every line of the
+    raw source. Here the source is stripped of literals and comments
+    once, full-file facts are hoisted out of the loop, and each check is
+    gated on a cheap substring test before its pattern runs — so
+    commented-out code no longer produces findings and most lines never
+    reach the regex engine.
+    """
+    findings = Findings()
+    has_delete = 'delete' in code
+
+    for lineno, line in _iter_lines(_strip_literals_and_comments(code)):
+        # Memory allocation without visible delete
+        if 'new ' in line and not has_delete:
+            findings.append(
+                CAT_MEMORY, SEV_WARNING,
+                'Memory allocation without visible delete - potential memory leak',
+                lineno,
+                suggestion='Ensure memory is freed with delete or use smart pointers'
+            )
+
+        # Null pointer dereference patterns
+        if ('NULL' in line or 'nullptr' in line) and _CPP_NULL_DEREF_RE.search(line):
+            findings.append(CAT_RUNTIME, SEV_ERROR,
+                            'Potential null pointer dereference', lineno)
+
+        # Missing semicolons in common patterns
+        if _missing_semicolon(line.strip()):
+            findings.append(CAT_SYNTAX, SEV_WARNING,
+                            'Possible missing semicolon', lineno)
+
+        # Common C++ issues
+        if 'using namespace std;' in line:
+            findings.append(
+                CAT_QUALITY, SEV_INFO,
+                'Using namespace std pollutes global namespace', lineno,
+                suggestion='Consider using std:: prefix instead'
+            )
+
+    return findings.to_dicts()
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_python_cached(code_hash: str, code: str):
+    """
+    Parse once per content hash, returning (tree, syntax_finding).
+
+    The syntax and runtime/logical checkers both need the tree, and the
+    pipeline re-analyzes the same snippet across agents; caching on the
+    hash means each distinct source is parsed exactly once. On failure
+    the tree is None and the finding describes the error.
+    """
+    try:
+        return ast.parse(code), None
+    except SyntaxError as e:
+        return None, {
+            'category': CAT_SYNTAX,
+            'severity': SEV_ERROR,
+            'message': f'Syntax Error: {e.msg}',
+            'line': e.lineno,
+            'column': e.offset,
+            'text': e.text.strip() if e.text else ''
+        }
+    except Exception as e:
+        return None, {
+            'category': CAT_SYNTAX,
+            'severity': SEV_ERROR,
+            'message': f'Parse Error: {str(e)}',
+            'line': 0
+        }
+
+
+def _parse_python(code: str):
+    """Parse via the hash-keyed LRU cache."""
+    code_hash = hashlib.blake2b(code.encode(), digest_size=16).hexdigest()
+    return _parse_python_cached(code_hash, code)
+
+
+def _check_binop(node, findings):
+    # Division by zero
+    if (isinstance(node.op, ast.Div)
+            and isinstance(node.right, ast.Constant)
+            and node.right.value == 0):
+        findings.append(CAT_RUNTIME, SEV_ERROR, 'Division by zero detected',
+                        node.lineno, suggestion='Add zero check before division')
+
+
+def _check_while(node, findings):
+    # Infinite loops (basic pattern)
+    if isinstance(node.test, ast.Constant) and node.test.value is True:
+        findings.append(CAT_LOGICAL, SEV_WARNING,
+                        'Potential infinite loop detected (while True)',
+                        node.lineno,
+                        suggestion='Ensure loop has proper exit condition')
+
+
+def _check_compare(node, findings):
+    # Comparison with None
+    for op, comparator in zip(node.ops, node.comparators):
+        if (isinstance(comparator, ast.Constant) and comparator.value is None
+                and isinstance(op, (ast.Eq, ast.NotEq))):
+            findings.append(CAT_LOGICAL, SEV_INFO,
+                            'Use "is None" instead of "== None"',
+                            node.lineno,
+                            suggestion='Replace == with is for None comparison')
+
+
+_NODE_HANDLERS = {
+    ast.BinOp: _check_binop,
+    ast.While: _check_while,
+    ast.Compare: _check_compare,
+}
+
+
+def _walk_python(tree: ast.AST) -> List[Dict[str, Any]]:
+    """
+    Fused runtime + logical AST pass.
+
+    A manual stack walk with a class-keyed handler table: the vast
+    majority of nodes (Name, Constant, Load, ...) cost one dict miss
+    instead of NodeVisitor's getattr dispatch plus generic_visit
+    recursion per node.
+    """
+    findings = Findings()
+    handlers = _NODE_HANDLERS
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        handler = handlers.get(node.__class__)
+        if handler is not None:
+            handler(node, findings)
+        stack.extend(ast.iter_child_nodes(node))
+    return findings.to_dicts()
+
+
+def _bracket_mismatches(code: str) -> List[Dict[str, Any]]:
+    """
+    Report unbalanced (), {} and [] with the line of the first bad closer.
+
+    The source is stripped of literals and comments, then reduced to its
+    bracket and newline bytes with one C-level translate; a depth walk
+    over that short residue replaces the former per-pair code.count()
+    scans. Tracking depth instead of totals also catches balanced-count
+    but mis-ordered input like ")(" and pins the finding to the line
+    where a closer first appears without a matching opener (0 when an
+    opener is simply never closed).
+    """
+    stripped = _strip_literals_and_comments(code)
+    walk = stripped.encode('utf-8', 'ignore').translate(None, _NON_BRACKET_BYTES)
+
+    lineno = 1
+    depths = [0, 0, 0]
+    first_bad = [0, 0, 0]
+    for byte in walk:
+        if byte == 0x0a:
+            lineno += 1
+            continue
+        index = _OPEN_INDEX.get(byte)
+        if index is not None:
+            depths[index] += 1
+            continue
+        index = _CLOSE_INDEX[byte]
+        depths[index] -= 1
+        if depths[index] < 0 and not first_bad[index]:
+            first_bad[index] = lineno
+
+    findings = Findings()
+    for (_, _, name), depth, bad_line in zip(_BRACKET_PAIRS, depths, first_bad):
+        if depth != 0 or bad_line:
+            findings.append(CAT_SYNTAX, SEV_ERROR, f'Mismatched {name}', bad_line)
+    return findings.to_dicts()
+
 
 class ErrorDetectorAgent(BaseAgent):
     """
@@ -17,236 +294,96 @@ class ErrorDetectorAgent(BaseAgent):
             'runtime': [],
             'logical': []
         }
-    
+        # Language dispatch table: one dict lookup of bound handlers
+        # replaces the if/elif chain walked on every analyze() call.
+        self._handlers = {
+            'python': (self._check_python_syntax, self._check_python_ast),
+            'javascript': (self._check_javascript_syntax,),
+            'typescript': (self._check_javascript_syntax,),
+            'cpp': (self._check_cpp_errors,),
+            'c': (self._check_cpp_errors,),
+            'java': (self._check_java_errors,)
+        }
+
     def analyze(self, code: str, language: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze code for errors."""
         findings = []
-        
-        if language == 'python':
-            findings.extend(self._check_python_syntax(code))
-            findings.extend(self._check_python_runtime(code))
-            findings.extend(self._check_logical_errors(code, language))
-        elif language in ['javascript', 'typescript']:
-            findings.extend(self._check_javascript_syntax(code))
-            findings.extend(self._check_logical_errors(code, language))
-        elif language in ['cpp', 'c']:
-            findings.extend(self._check_cpp_errors(code))
-        elif language == 'java':
-            findings.extend(self._check_java_errors(code))
-        else:
+
+        handlers = self._handlers.get(language)
+        if handlers is None:
             findings.extend(self._check_generic_errors(code, language))
-        
+        else:
+            for check in handlers:
+                findings.extend(check(code))
+
+        # One Counter pass replaces three filtering list comprehensions
+        counts = Counter(f.get('category') for f in findings)
+
         return {
             "agent": self.name,
             "status": "success",
             "findings": findings,
             "metadata": {
                 "total_errors": len(findings),
-                "syntax_errors": len([f for f in findings if f.get('category') == 'syntax']),
-                "runtime_errors": len([f for f in findings if f.get('category') == 'runtime']),
-                "logical_errors": len([f for f in findings if f.get('category') == 'logical'])
+                "syntax_errors": counts[CAT_SYNTAX],
+                "runtime_errors": counts[CAT_RUNTIME],
+                "logical_errors": counts[CAT_LOGICAL]
             }
         }
     
     def _check_python_syntax(self, code: str) -> List[Dict[str, Any]]:
         """Check Python syntax errors."""
-        errors = []
-        try:
-            ast.parse(code)
-        except SyntaxError as e:
-            errors.append({
-                'category': 'syntax',
-                'severity': 'error',
-                'message': f'Syntax Error: {e.msg}',
-                'line': e.lineno,
-                'column': e.offset,
-                'text': e.text.strip() if e.text else ''
-            })
-        except Exception as e:
-            errors.append({
-                'category': 'syntax',
-                'severity': 'error',
-                'message': f'Parse Error: {str(e)}',
-                'line': 0
-            })
-        return errors
+        _, syntax_finding = _parse_python(code)
+        # Copy so callers can't mutate the cached finding
+        return [dict(syntax_finding)] if syntax_finding else []
     
-    def _check_python_runtime(self, code: str) -> List[Dict[str, Any]]:
-        """Check for potential runtime errors using static analysis."""
-        errors = []
-        try:
-            tree = ast.parse(code)
-            
-            # Check for common runtime error patterns
-            for node in ast.walk(tree):
-                # Division by zero
-                if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
-                    if isinstance(node.right, ast.Constant) and node.right.value == 0:
-                        errors.append({
-                            'category': 'runtime',
-                            'severity': 'error',
-                            'message': 'Division by zero detected',
-                            'line': node.lineno,
-                            'suggestion': 'Add zero check before division'
-                        })
-                
-                # Undefined variable usage (basic check)
-                if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                    # This is a simplified check - full analysis needs scope tracking
-                    pass
-                    
-        except:
-            pass
-        
-        return errors
+    def _check_python_ast(self, code: str) -> List[Dict[str, Any]]:
+        """Check for potential runtime and logical errors in one AST pass."""
+        tree, _ = _parse_python(code)
+        if tree is None:
+            # Already reported by _check_python_syntax
+            return []
+
+        return _walk_python(tree)
     
     def _check_javascript_syntax(self, code: str) -> List[Dict[str, Any]]:
         """Check JavaScript syntax (basic checks)."""
-        errors = []
-        
         # Basic syntax checks
-        if code.count('(') != code.count(')'):
-            errors.append({
-                'category': 'syntax',
-                'severity': 'error',
-                'message': 'Mismatched parentheses',
-                'line': 0
-            })
-        
-        if code.count('{') != code.count('}'):
-            errors.append({
-                'category': 'syntax',
-                'severity': 'error',
-                'message': 'Mismatched braces',
-                'line': 0
-            })
-        
-        if code.count('[') != code.count(']'):
-            errors.append({
-                'category': 'syntax',
-                'severity': 'error',
-                'message': 'Mismatched brackets',
-                'line': 0
-            })
-        
-        return errors
-    
-    def _check_logical_errors(self, code: str, language: str) -> List[Dict[str, Any]]:
-        """Check for logical errors and anti-patterns."""
-        errors = []
-        
-        if language == 'python':
-            try:
-                tree = ast.parse(code)
-                
-                for node in ast.walk(tree):
-                    # Check for infinite loops (basic pattern)
-                    if isinstance(node, ast.While):
-                        if isinstance(node.test, ast.Constant) and node.test.value is True:
-                            errors.append({
-                                'category': 'logical',
-                                'severity': 'warning',
-                                'message': 'Potential infinite loop detected (while True)',
-                                'line': node.lineno,
-                                'suggestion': 'Ensure loop has proper exit condition'
-                            })
-                    
-                    # Check for comparison with None
-                    if isinstance(node, ast.Compare):
-                        for op, comparator in zip(node.ops, node.comparators):
-                            if isinstance(comparator, ast.Constant) and comparator.value is None:
-                                if isinstance(op, (ast.Eq, ast.NotEq)):
-                                    errors.append({
-                                        'category': 'logical',
-                                        'severity': 'info',
-                                        'message': 'Use "is None" instead of "== None"',
-                                        'line': node.lineno,
-                                        'suggestion': 'Replace == with is for None comparison'
-                                    })
-            except:
-                pass
-        
-        return errors
+        return _bracket_mismatches(code)
     
     def _check_cpp_errors(self, code: str) -> List[Dict[str, Any]]:
         """Check C/C++ code for common errors."""
-        import re
         errors = []
-        lines = code.split('\n')
-        
+
         # Check for basic syntax issues
-        if code.count('(') != code.count(')'):
-            errors.append({
-                'category': 'syntax',
-                'severity': 'error',
-                'message': 'Mismatched parentheses',
-                'line': 0
-            })
-        
-        if code.count('{') != code.count('}'):
-            errors.append({
-                'category': 'syntax',
-                'severity': 'error',
-                'message': 'Mismatched braces',
-                'line': 0
-            })
-        
-        # Check for memory issues
-        for i, line in enumerate(lines, 1):
-            # Check for new without delete
-            if 'new ' in line and 'delete' not in code:
-                errors.append({
-                    'category': 'memory',
-                    'severity': 'warning',
-                    'message': 'Memory allocation without visible delete - potential memory leak',
-                    'line': i,
-                    'suggestion': 'Ensure memory is freed with delete or use smart pointers'
-                })
-            
-            # Check for null pointer dereference patterns
-            if re.search(r'\*\s*NULL', line) or re.search(r'\*\s*nullptr', line):
-                errors.append({
-                    'category': 'runtime',
-                    'severity': 'error',
-                    'message': 'Potential null pointer dereference',
-                    'line': i
-                })
-            
-            # Check for missing semicolons in common patterns
-            if re.search(r'(return|break|continue)\s+[^;{}\s]+\s*$', line.strip()):
-                errors.append({
-                    'category': 'syntax',
-                    'severity': 'warning',
-                    'message': 'Possible missing semicolon',
-                    'line': i
-                })
-            
-            # Check for common C++ issues
-            if 'using namespace std;' in line:
-                errors.append({
-                    'category': 'quality',
-                    'severity': 'info',
-                    'message': 'Using namespace std pollutes global namespace',
-                    'line': i,
-                    'suggestion': 'Consider using std:: prefix instead'
-                })
-        
-        # Check for uninitialized variables (basic)
-        var_declarations = re.findall(r'\b(int|float|double|char|bool)\s+(\w+)\s*;', code)
-        for type_name, var_name in var_declarations:
-            if not re.search(rf'{var_name}\s*=', code):
+        errors.extend(_bracket_mismatches(code))
+
+        # Per-line memory/runtime/style checks in one scan
+        errors.extend(_scan_cpp(code))
+
+        # Check for uninitialized variables (basic): one findall builds
+        # the set of all assigned names instead of running a freshly
+        # built per-variable regex over the whole source
+        assigned = None
+        for match in _CPP_VAR_DECL_RE.finditer(code):
+            if assigned is None:
+                assigned = set(_ASSIGNMENT_RE.findall(code))
+            var_name = match.group(2)
+            if var_name not in assigned:
                 errors.append({
-                    'category': 'runtime',
-                    'severity': 'warning',
+                    'category': CAT_RUNTIME,
+                    'severity': SEV_WARNING,
                     'message': f'Variable "{var_name}" may be uninitialized',
-                    'line': 0,
+                    # count('\n', 0, off) resolves the line only for the
+                    # rare finding, without materializing the line list
+                    'line': code.count('\n', 0, match.start()) + 1,
                     'suggestion': 'Initialize variables at declaration'
                 })
         
         if not errors:
             errors.append({
-                'category': 'info',
-                'severity': 'info',
+                'category': CAT_INFO,
+                'severity': SEV_INFO,
                 'message': 'No obvious errors detected in C++ code',
                 'line': 0
             })
@@ -255,57 +392,43 @@ class ErrorDetectorAgent(BaseAgent):
     
     def _check_java_errors(self, code: str) -> List[Dict[str, Any]]:
         """Check Java code for common errors."""
-        import re
         errors = []
-        lines = code.split('\n')
-        
+
         # Check for basic syntax issues
-        if code.count('(') != code.count(')'):
-            errors.append({
-                'category': 'syntax',
-                'severity': 'error',
-                'message': 'Mismatched parentheses',
-                'line': 0
-            })
-        
-        if code.count('{') != code.count('}'):
-            errors.append({
-                'category': 'syntax',
-                'severity': 'error',
-                'message': 'Mismatched braces',
-                'line': 0
-            })
-        
-        for i, line in enumerate(lines, 1):
+        errors.extend(_bracket_mismatches(code))
+
+        # Local binding skips the attribute lookup on every line
+        _resource_search = _JAVA_RESOURCE_RE.search
+
+        # Full-file facts hoisted out of the loop: scanning the whole
+        # source per matching line made the check O(lines x bytes)
+        unclosed_resources = ('try-with-resources' not in code
+                              and '.close()' not in code)
+
+        for i, line in _iter_lines(code):
             # Check for null comparisons
             if '== null' in line or '!= null' in line:
                 errors.append({
-                    'category': 'quality',
-                    'severity': 'info',
+                    'category': CAT_QUALITY,
+                    'severity': SEV_INFO,
                     'message': 'Consider using Objects.isNull() or Objects.nonNull()',
                     'line': i
                 })
-            
-            # Check for potential NullPointerException
-            if re.search(r'\.\w+\s*\(', line) and 'null' in code:
-                # This is a very basic check
-                pass
-            
+
             # Check for resource leaks
-            if re.search(r'new\s+(FileInputStream|FileOutputStream|BufferedReader|Scanner)', line):
-                if 'try-with-resources' not in code and '.close()' not in code:
-                    errors.append({
-                        'category': 'resource',
-                        'severity': 'warning',
-                        'message': 'Resource may not be properly closed',
-                        'line': i,
-                        'suggestion': 'Use try-with-resources or ensure .close() is called'
-                    })
+            if unclosed_resources and 'new' in line and _resource_search(line):
+                errors.append({
+                    'category': CAT_RESOURCE,
+                    'severity': SEV_WARNING,
+                    'message': 'Resource may not be properly closed',
+                    'line': i,
+                    'suggestion': 'Use try-with-resources or ensure .close() is called'
+                })
         
         if not errors:
             errors.append({
-                'category': 'info',
-                'severity': 'info',
+                'category': CAT_INFO,
+                'severity': SEV_INFO,
                 'message': 'No obvious errors detected in Java code',
                 'line': 0
             })
@@ -314,37 +437,13 @@ class ErrorDetectorAgent(BaseAgent):
     
     def _check_generic_errors(self, code: str, language: str) -> List[Dict[str, Any]]:
         """Generic error checking for unsupported languages."""
-        errors = []
-        
         # Basic bracket matching
-        if code.count('(') != code.count(')'):
-            errors.append({
-                'category': 'syntax',
-                'severity': 'error',
-                'message': 'Mismatched parentheses',
-                'line': 0
-            })
-        
-        if code.count('{') != code.count('}'):
-            errors.append({
-                'category': 'syntax',
-                'severity': 'error',
-                'message': 'Mismatched braces',
-                'line': 0
-            })
-        
-        if code.count('[') != code.count(']'):
-            errors.append({
-                'category': 'syntax',
-                'severity': 'error',
-                'message': 'Mismatched brackets',
-                'line': 0
-            })
-        
+        errors = _bracket_mismatches(code)
+
         if not errors:
             errors.append({
-                'category': 'info',
-                'severity': 'info',
+                'category': CAT_INFO,
+                'severity': SEV_INFO,
                 'message': f'Basic syntax check passed for {language}',
                 'line': 0
             })
@@ -0,0 +1,147 @@
+"""
+Structured finding records for the complexity analyzer.
+
+Per-item findings (one per function in the analyzed file) used to be
+ad-hoc dicts with 6-8 string keys each; on large files thousands of
+them dominate allocation and GC cost. Slotted dataclasses keep the
+fields in fixed slots instead of a per-instance dict, and to_dict()
+restores the plain-dict shape once at the API boundary so downstream
+JSON serialization is unchanged.
+"""
+import array
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# Interned category/severity vocabulary. Findings draw from a small
+# closed set of values; interning guarantees one shared string object
+# per value, so the metadata tallies and cross-agent category filters
+# compare by pointer rather than by content.
+CAT_SYNTAX = sys.intern('syntax')
+CAT_RUNTIME = sys.intern('runtime')
+CAT_LOGICAL = sys.intern('logical')
+CAT_MEMORY = sys.intern('memory')
+CAT_MEMORY_LEAK = sys.intern('memory_leak')
+CAT_MEMORY_ALLOCATION = sys.intern('memory_allocation')
+CAT_DANGLING_POINTER = sys.intern('dangling_pointer')
+CAT_RESOURCE_LEAK = sys.intern('resource_leak')
+CAT_ALLOCATION = sys.intern('allocation')
+CAT_QUALITY = sys.intern('quality')
+CAT_RESOURCE = sys.intern('resource')
+CAT_OPTIMIZATION = sys.intern('optimization')
+CAT_CODE_SMELL = sys.intern('code_smell')
+CAT_BEST_PRACTICE = sys.intern('best_practice')
+CAT_TIME_COMPLEXITY = sys.intern('time_complexity')
+CAT_INFO = sys.intern('info')
+
+SEV_ERROR = sys.intern('error')
+SEV_WARNING = sys.intern('warning')
+SEV_INFO = sys.intern('info')
+SEV_HIGH = sys.intern('high')
+SEV_MEDIUM = sys.intern('medium')
+SEV_CRITICAL = sys.intern('critical')
+
+
+@dataclass(slots=True)
+class CCFinding:
+    """One cyclomatic-complexity result for a function or method."""
+    name: str
+    complexity: int
+    line: int
+    severity: str
+    suggestion: Optional[str] = None
+
+    @property
+    def message(self) -> str:
+        # Formatted on demand: metadata aggregation only reads the
+        # numeric fields, so most messages are never built until the
+        # finding is serialized for the client.
+        return f'{self.name} has cyclomatic complexity of {self.complexity}'
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'category': 'cyclomatic_complexity',
+            'name': self.name,
+            'complexity': self.complexity,
+            'line': self.line,
+            'severity': self.severity,
+            'message': self.message,
+            'suggestion': self.suggestion
+        }
+
+
+@dataclass(slots=True)
+class TimeComplexityFinding:
+    """One estimated Big-O result for a function."""
+    function: str
+    big_o: str
+    line: int
+    severity: str
+    explanation: str
+
+    @property
+    def message(self) -> str:
+        return f'{self.function} has time complexity {self.big_o}'
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'category': 'time_complexity',
+            'function': self.function,
+            'big_o': self.big_o,
+            'line': self.line,
+            'severity': self.severity,
+            'message': self.message,
+            'explanation': self.explanation
+        }
+
+
+@dataclass
+class Findings:
+    """
+    Structure-of-arrays accumulator for checker findings.
+
+    Checkers that emit many findings per file store the four common
+    fields in parallel lists (line numbers in a packed int array)
+    instead of one dict per finding; the dicts are materialized once at
+    the serialization boundary via to_dicts(). Rare per-finding extras
+    (suggestion, column, ...) ride along in a sparse side list.
+    """
+    categories: List[str] = field(default_factory=list)
+    severities: List[str] = field(default_factory=list)
+    messages: List[str] = field(default_factory=list)
+    lines: 'array.array' = field(default_factory=lambda: array.array('i'))
+    extras: List[Optional[Dict[str, Any]]] = field(default_factory=list)
+
+    def append(self, category: str, severity: str, message: str,
+               line: int = 0, **extra: Any) -> None:
+        self.categories.append(category)
+        self.severities.append(severity)
+        self.messages.append(message)
+        self.lines.append(line)
+        self.extras.append(extra or None)
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        result = []
+        for i, category in enumerate(self.categories):
+            finding = {
+                'category': category,
+                'severity': self.severities[i],
+                'message': self.messages[i],
+                'line': self.lines[i]
+            }
+            extra = self.extras[i]
+            if extra:
+                finding.update(extra)
+            result.append(finding)
+        return result
+
+
+def to_dicts(findings: List[Any]) -> List[Dict[str, Any]]:
+    """Convert dataclass findings to dicts; plain dicts pass through."""
+    return [
+        finding.to_dict() if hasattr(finding, 'to_dict') else finding
+        for finding in findings
+    ]
@@ -1,5 +1,6 @@
 from typing import Dict, Any, List
 from .base_agent import BaseAgent
+from .findings import CAT_SYNTAX, CAT_TIME_COMPLEXITY
 import os
 
 class FixSuggesterAgent(BaseAgent):
@@ -52,7 +53,7 @@ class FixSuggesterAgent(BaseAgent):
         suggestions = []
         
         for finding in findings:
-            if finding.get('category') == 'syntax':
+            if finding.get('category') == CAT_SYNTAX:
                 if 'Division by zero' in finding.get('message', ''):
                     suggestions.append({
                         'issue': 'Division by zero',
@@ -70,7 +71,7 @@ class FixSuggesterAgent(BaseAgent):
         suggestions = []
         
         for finding in findings:
-            if finding.get('category') == 'time_complexity':
+            if finding.get('category') == CAT_TIME_COMPLEXITY:
                 big_o = finding.get('big_o', '')
                 if 'O(n²)' in big_o or 'O(n^2)' in big_o:
                     suggestions.append({
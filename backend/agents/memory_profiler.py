@@ -1,252 +1,372 @@
 from typing import Dict, Any, List
 from .base_agent import BaseAgent
+from .error_detector import _iter_lines, _parse_python
+from .findings import (Findings, CAT_ALLOCATION, CAT_BEST_PRACTICE,
+                       CAT_DANGLING_POINTER, CAT_INFO, CAT_MEMORY_ALLOCATION,
+                       CAT_MEMORY_LEAK, CAT_OPTIMIZATION, CAT_RESOURCE_LEAK,
+                       SEV_INFO, SEV_WARNING)
+import ast
 import re
 
+# Compiled once at import; analyze() runs per request, so inline
+# re.findall/re.search calls were paying the pattern-cache lookup on
+# every invocation.
+_RE_NEW_ARRAY = re.compile(r'new\s+\w+\s*\[')
+_RE_NULLPTR_ASSIGN = re.compile(r'=\s*nullptr')
+_RE_JAVA_LOOP_NEW = re.compile(r'for\s*\([^)]+\)\s*\{[^}]*new\s+')
+# Leak-prone Java resource types, matched in one alternation pass
+# instead of one substring scan per name.
+_JAVA_RESOURCES = ('FileInputStream', 'FileOutputStream', 'BufferedReader',
+                   'BufferedWriter', 'Connection', 'Statement', 'ResultSet',
+                   'Scanner')
+_RE_JAVA_RESOURCE = re.compile('|'.join(_JAVA_RESOURCES))
+_RE_JS_GLOBAL_VAR = re.compile(r'^var\s+', re.MULTILINE)
+# One alternation with named groups: the generic checks want to know
+# which allocation styles appear, and a single combined scan answers
+# that in one pass instead of one scan per pattern.
+_RE_GENERIC_ALLOC = re.compile(r'(?P<new>\bnew\b)|(?P<cstyle>\b(?:malloc|alloc)\b)')
+
+
+def _scan_python_memory(tree: ast.AST) -> List[Dict[str, Any]]:
+    """
+    One stack walk over the AST collecting all Python memory findings.
+
+    Replaces the old substring heuristics ('[' and 'for' and 'in range'
+    fired on almost any file) with structural checks carrying real line
+    numbers; a with-flag travels down the stack so open() inside a
+    context manager isn't flagged.
+    """
+    findings = Findings()
+    stack = [(tree, False)]
+    while stack:
+        node, in_with = stack.pop()
+
+        if isinstance(node, ast.ListComp):
+            findings.append(
+                CAT_OPTIMIZATION, SEV_INFO,
+                'Consider using generators instead of list comprehensions for large datasets',
+                node.lineno,
+                suggestion='Use (x for x in ...) instead of [x for x in ...]')
+        elif isinstance(node, ast.Global):
+            findings.append(
+                CAT_MEMORY_LEAK, SEV_WARNING,
+                'Global variables detected - may cause memory retention',
+                node.lineno,
+                suggestion='Consider using local variables or class instances')
+        elif (isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id == 'open'
+                and not in_with):
+            findings.append(
+                CAT_MEMORY_LEAK, SEV_WARNING,
+                'File opened without context manager - may leak file handles',
+                node.lineno,
+                suggestion='Use "with open(...) as f:" to ensure proper cleanup')
+
+        if isinstance(node, (ast.With, ast.AsyncWith)):
+            in_with = True
+        stack.extend((child, in_with) for child in ast.iter_child_nodes(node))
+
+    return findings.to_dicts()
+
+
+def _scan_cpp_memory(code: str) -> Dict[str, Any]:
+    """
+    One pass over C/C++ source collecting every fact the memory checks
+    need: allocation/deallocation counts, dynamic-array lines, smart
+    pointer and nullptr usage. The previous implementation streamed the
+    whole string once per check (6+ regex passes plus a split); fusing
+    them keeps each line hot in cache while all counters update.
+    """
+    new_count = delete_count = malloc_count = free_count = 0
+    array_lines = []
+    has_smart_ptr = False
+    has_delete = False
+    nullptr_assigned = False
+
+    for lineno, line in _iter_lines(code):
+        new_count += (line.count('new ') + line.count('new\t')
+                      + line.endswith('new'))
+        if 'delete' in line:
+            has_delete = True
+            delete_count += (line.count('delete ') + line.count('delete\t')
+                             + line.endswith('delete'))
+        malloc_count += line.count('malloc(') + line.count('malloc (')
+        free_count += line.count('free(') + line.count('free (')
+        if 'new' in line and _RE_NEW_ARRAY.search(line):
+            array_lines.append(lineno)
+        if not has_smart_ptr and ('unique_ptr' in line or 'shared_ptr' in line):
+            has_smart_ptr = True
+        # Substring tests cover the common spellings; the regex only
+        # runs for unusual whitespace between '=' and 'nullptr'.
+        if not nullptr_assigned and 'nullptr' in line and (
+                '=nullptr' in line or '= nullptr' in line
+                or _RE_NULLPTR_ASSIGN.search(line) is not None):
+            nullptr_assigned = True
+
+    return {
+        'new': new_count,
+        'delete': delete_count,
+        'malloc': malloc_count,
+        'free': free_count,
+        'array_lines': array_lines,
+        'has_smart_ptr': has_smart_ptr,
+        'has_delete': has_delete,
+        'nullptr_assigned': nullptr_assigned
+    }
+
+
 class MemoryProfilerAgent(BaseAgent):
     """
     Analyzes memory usage patterns and detects potential memory leaks.
     """
     
+    def __init__(self, config=None):
+        super().__init__(config)
+        # Language dispatch table, mirroring ErrorDetectorAgent
+        self._handlers = {
+            'python': self._analyze_python_memory,
+            'cpp': self._analyze_cpp_memory,
+            'c': self._analyze_cpp_memory,
+            'java': self._analyze_java_memory,
+            'javascript': self._analyze_js_memory,
+            'typescript': self._analyze_js_memory
+        }
+
     def analyze(self, code: str, language: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze memory usage patterns."""
-        findings = []
-        
-        if language == 'python':
-            findings.extend(self._analyze_python_memory(code))
-        elif language in ['cpp', 'c']:
-            findings.extend(self._analyze_cpp_memory(code))
-        elif language == 'java':
-            findings.extend(self._analyze_java_memory(code))
-        elif language in ['javascript', 'typescript']:
-            findings.extend(self._analyze_js_memory(code))
+        # Nothing to profile in empty or trivially short input; skip
+        # the per-language scans entirely
+        if len(code) < 8 or not code.strip():
+            return {
+                "agent": self.name,
+                "status": "success",
+                "findings": [],
+                "metadata": {
+                    "potential_leaks": 0,
+                    "optimizations": 0
+                }
+            }
+
+        handler = self._handlers.get(language)
+        if handler is None:
+            findings = self._analyze_generic_memory(code, language)
         else:
-            findings.extend(self._analyze_generic_memory(code, language))
-        
+            findings = handler(code)
+
+        # Tally severities and categories in one pass over the findings
+        leaks = 0
+        optimizations = 0
+        for finding in findings:
+            if finding.get('severity') == SEV_WARNING:
+                leaks += 1
+            if finding.get('category') == CAT_OPTIMIZATION:
+                optimizations += 1
+
         return {
             "agent": self.name,
             "status": "success",
             "findings": findings,
             "metadata": {
-                "potential_leaks": len([f for f in findings if f.get('severity') == 'warning']),
-                "optimizations": len([f for f in findings if f.get('category') == 'optimization'])
+                "potential_leaks": leaks,
+                "optimizations": optimizations
             }
         }
     
     def _analyze_python_memory(self, code: str) -> List[Dict[str, Any]]:
         """Analyze Python memory patterns."""
-        findings = []
-        
-        # Check for large list comprehensions
-        if '[' in code and 'for' in code and 'in range' in code:
-            findings.append({
-                'category': 'optimization',
-                'severity': 'info',
-                'message': 'Consider using generators instead of list comprehensions for large datasets',
-                'suggestion': 'Use (x for x in ...) instead of [x for x in ...]'
-            })
-        
-        # Check for global variables
-        if 'global ' in code:
-            findings.append({
-                'category': 'memory_leak',
-                'severity': 'warning',
-                'message': 'Global variables detected - may cause memory retention',
-                'suggestion': 'Consider using local variables or class instances'
-            })
-        
-        # Check for unclosed resources
-        if 'open(' in code and 'with' not in code:
-            findings.append({
-                'category': 'memory_leak',
-                'severity': 'warning',
-                'message': 'File opened without context manager - may leak file handles',
-                'suggestion': 'Use "with open(...) as f:" to ensure proper cleanup'
-            })
-        
-        return findings
+        # Reuse the error detector's cached parse; the same snippet has
+        # usually been parsed by that agent already in the pipeline.
+        tree, _ = _parse_python(code)
+        if tree is None:
+            # Unparsable source is reported by the error detector
+            return []
+        return _scan_python_memory(tree)
     
     def _analyze_cpp_memory(self, code: str) -> List[Dict[str, Any]]:
         """Analyze C/C++ memory patterns."""
-        findings = []
-        lines = code.split('\n')
-        
-        # Count allocations and deallocations
-        new_count = len(re.findall(r'\bnew\s+', code))
-        delete_count = len(re.findall(r'\bdelete\s+', code))
-        malloc_count = len(re.findall(r'\bmalloc\s*\(', code))
-        free_count = len(re.findall(r'\bfree\s*\(', code))
-        
+        # Guard clause: every check below keys off one of these words,
+        # so their absence means the full scan can't produce anything
+        if not any(k in code for k in ('new', 'delete', 'malloc', 'free',
+                                       'unique_ptr', 'shared_ptr')):
+            return [{
+                'category': CAT_INFO,
+                'severity': SEV_INFO,
+                'message': 'No obvious memory issues detected in C++ code',
+                'line': 0
+            }]
+
+        findings = Findings()
+        scan = _scan_cpp_memory(code)
+        new_count = scan['new']
+        delete_count = scan['delete']
+        malloc_count = scan['malloc']
+        free_count = scan['free']
+
         # Check for memory leaks
         if new_count > delete_count:
-            findings.append({
-                'category': 'memory_leak',
-                'severity': 'warning',
-                'message': f'Potential memory leak: {new_count} new allocations but only {delete_count} delete calls',
-                'suggestion': 'Ensure every new has a corresponding delete, or use smart pointers'
-            })
-        
+            findings.append(
+                CAT_MEMORY_LEAK, SEV_WARNING,
+                f'Potential memory leak: {new_count} new allocations but only {delete_count} delete calls',
+                suggestion='Ensure every new has a corresponding delete, or use smart pointers')
+
         if malloc_count > free_count:
-            findings.append({
-                'category': 'memory_leak',
-                'severity': 'warning',
-                'message': f'Potential memory leak: {malloc_count} malloc calls but only {free_count} free calls',
-                'suggestion': 'Ensure every malloc has a corresponding free'
-            })
-        
+            findings.append(
+                CAT_MEMORY_LEAK, SEV_WARNING,
+                f'Potential memory leak: {malloc_count} malloc calls but only {free_count} free calls',
+                suggestion='Ensure every malloc has a corresponding free')
+
         # Check for smart pointer usage (good practice)
-        if 'unique_ptr' in code or 'shared_ptr' in code:
-            findings.append({
-                'category': 'best_practice',
-                'severity': 'info',
-                'message': 'Good: Using smart pointers for automatic memory management'
-            })
+        if scan['has_smart_ptr']:
+            findings.append(
+                CAT_BEST_PRACTICE, SEV_INFO,
+                'Good: Using smart pointers for automatic memory management')
         elif new_count > 0:
-            findings.append({
-                'category': 'optimization',
-                'severity': 'info',
-                'message': 'Consider using smart pointers (unique_ptr, shared_ptr) instead of raw pointers',
-                'suggestion': 'Replace raw pointers with std::unique_ptr or std::shared_ptr'
-            })
-        
+            findings.append(
+                CAT_OPTIMIZATION, SEV_INFO,
+                'Consider using smart pointers (unique_ptr, shared_ptr) instead of raw pointers',
+                suggestion='Replace raw pointers with std::unique_ptr or std::shared_ptr')
+
         # Check for array allocations
-        for i, line in enumerate(lines, 1):
-            if re.search(r'new\s+\w+\s*\[', line):
-                findings.append({
-                    'category': 'memory_allocation',
-                    'severity': 'info',
-                    'message': f'Dynamic array allocation at line {i}',
-                    'line': i,
-                    'suggestion': 'Consider using std::vector for safer array management'
-                })
-        
+        for i in scan['array_lines']:
+            findings.append(
+                CAT_MEMORY_ALLOCATION, SEV_INFO,
+                f'Dynamic array allocation at line {i}', i,
+                suggestion='Consider using std::vector for safer array management')
+
         # Check for potential dangling pointers
-        if 'delete' in code and re.search(r'=\s*nullptr', code) == None:
-            findings.append({
-                'category': 'dangling_pointer',
-                'severity': 'warning',
-                'message': 'Pointer deleted but not set to nullptr - potential dangling pointer',
-                'suggestion': 'Set pointer to nullptr after deletion'
-            })
-        
+        if scan['has_delete'] and not scan['nullptr_assigned']:
+            findings.append(
+                CAT_DANGLING_POINTER, SEV_WARNING,
+                'Pointer deleted but not set to nullptr - potential dangling pointer',
+                suggestion='Set pointer to nullptr after deletion')
+
         if not findings:
-            findings.append({
-                'category': 'info',
-                'severity': 'info',
-                'message': 'No obvious memory issues detected in C++ code'
-            })
-        
-        return findings
+            findings.append(
+                CAT_INFO, SEV_INFO,
+                'No obvious memory issues detected in C++ code')
+
+        return findings.to_dicts()
     
     def _analyze_java_memory(self, code: str) -> List[Dict[str, Any]]:
         """Analyze Java memory patterns."""
-        findings = []
-        
-        # Check for resource leaks
-        resources = ['FileInputStream', 'FileOutputStream', 'BufferedReader', 
-                     'BufferedWriter', 'Connection', 'Statement', 'ResultSet', 'Scanner']
-        
-        for resource in resources:
-            if resource in code:
-                if 'try-with-resources' not in code and '.close()' not in code:
-                    findings.append({
-                        'category': 'resource_leak',
-                        'severity': 'warning',
-                        'message': f'{resource} detected - ensure proper closure',
-                        'suggestion': 'Use try-with-resources: try (Resource r = new Resource()) { ... }'
-                    })
-        
+        # Guard clause: all Java checks need an allocation, a String
+        # concatenation or one of the leak-prone resource types
+        if ('new' not in code and 'String' not in code
+                and _RE_JAVA_RESOURCE.search(code) is None):
+            return [{
+                'category': CAT_INFO,
+                'severity': SEV_INFO,
+                'message': 'No obvious memory issues detected in Java code',
+                'line': 0
+            }]
+
+        findings = Findings()
+
+        # Check for resource leaks: one alternation pass collects every
+        # resource type present, replacing eight independent substring
+        # scans over the whole source
+        if 'try-with-resources' not in code and '.close()' not in code:
+            found = set(_RE_JAVA_RESOURCE.findall(code))
+            for resource in _JAVA_RESOURCES:
+                if resource in found:
+                    findings.append(
+                        CAT_RESOURCE_LEAK, SEV_WARNING,
+                        f'{resource} detected - ensure proper closure',
+                        suggestion='Use try-with-resources: try (Resource r = new Resource()) { ... }')
+
         # Check for large object creation in loops
-        if re.search(r'for\s*\([^)]+\)\s*\{[^}]*new\s+', code):
-            findings.append({
-                'category': 'optimization',
-                'severity': 'info',
-                'message': 'Object creation inside loop - may impact memory',
-                'suggestion': 'Consider creating objects outside loops when possible'
-            })
-        
+        if _RE_JAVA_LOOP_NEW.search(code):
+            findings.append(
+                CAT_OPTIMIZATION, SEV_INFO,
+                'Object creation inside loop - may impact memory',
+                suggestion='Consider creating objects outside loops when possible')
+
         # Check for StringBuilder usage
         if 'String +' in code or '+= String' in code:
-            findings.append({
-                'category': 'optimization',
-                'severity': 'info',
-                'message': 'String concatenation detected - consider StringBuilder for loops',
-                'suggestion': 'Use StringBuilder for multiple string concatenations'
-            })
-        
+            findings.append(
+                CAT_OPTIMIZATION, SEV_INFO,
+                'String concatenation detected - consider StringBuilder for loops',
+                suggestion='Use StringBuilder for multiple string concatenations')
+
         if not findings:
-            findings.append({
-                'category': 'info',
-                'severity': 'info',
-                'message': 'No obvious memory issues detected in Java code'
-            })
-        
-        return findings
+            findings.append(
+                CAT_INFO, SEV_INFO,
+                'No obvious memory issues detected in Java code')
+
+        return findings.to_dicts()
     
     def _analyze_js_memory(self, code: str) -> List[Dict[str, Any]]:
         """Analyze JavaScript memory patterns."""
-        findings = []
-        
+        # Guard clause: skip the scans when none of the feature words
+        # are present
+        if not any(k in code for k in ('var', 'addEventListener', 'setInterval')):
+            return [{
+                'category': CAT_INFO,
+                'severity': SEV_INFO,
+                'message': 'No obvious memory issues detected in JavaScript code',
+                'line': 0
+            }]
+
+        findings = Findings()
+
         # Check for global variables
-        if re.search(r'^var\s+', code, re.MULTILINE):
-            findings.append({
-                'category': 'memory_leak',
-                'severity': 'info',
-                'message': 'Global var declarations detected',
-                'suggestion': 'Use let or const to limit variable scope'
-            })
-        
+        if _RE_JS_GLOBAL_VAR.search(code):
+            findings.append(
+                CAT_MEMORY_LEAK, SEV_INFO,
+                'Global var declarations detected',
+                suggestion='Use let or const to limit variable scope')
+
         # Check for event listener cleanup
         if 'addEventListener' in code and 'removeEventListener' not in code:
-            findings.append({
-                'category': 'memory_leak',
-                'severity': 'warning',
-                'message': 'Event listeners added without removal - potential memory leak',
-                'suggestion': 'Remove event listeners when no longer needed'
-            })
-        
+            findings.append(
+                CAT_MEMORY_LEAK, SEV_WARNING,
+                'Event listeners added without removal - potential memory leak',
+                suggestion='Remove event listeners when no longer needed')
+
         # Check for closure memory issues
         if 'setInterval' in code and 'clearInterval' not in code:
-            findings.append({
-                'category': 'memory_leak',
-                'severity': 'warning',
-                'message': 'setInterval without clearInterval - memory may not be released',
-                'suggestion': 'Store interval ID and call clearInterval when done'
-            })
-        
+            findings.append(
+                CAT_MEMORY_LEAK, SEV_WARNING,
+                'setInterval without clearInterval - memory may not be released',
+                suggestion='Store interval ID and call clearInterval when done')
+
         if not findings:
-            findings.append({
-                'category': 'info',
-                'severity': 'info',
-                'message': 'No obvious memory issues detected in JavaScript code'
-            })
-        
-        return findings
+            findings.append(
+                CAT_INFO, SEV_INFO,
+                'No obvious memory issues detected in JavaScript code')
+
+        return findings.to_dicts()
     
     def _analyze_generic_memory(self, code: str, language: str) -> List[Dict[str, Any]]:
         """Generic memory analysis for unsupported languages."""
-        findings = []
-        
-        # Basic pattern detection
-        if re.search(r'\bnew\b', code):
-            findings.append({
-                'category': 'allocation',
-                'severity': 'info',
-                'message': 'Dynamic memory allocation detected'
-            })
-        
-        if re.search(r'\b(malloc|alloc)\b', code):
-            findings.append({
-                'category': 'allocation',
-                'severity': 'info',
-                'message': 'C-style memory allocation detected'
-            })
-        
+        findings = Findings()
+
+        # Basic pattern detection: one combined scan, stopping as soon
+        # as both allocation styles have been seen
+        has_new = has_cstyle = False
+        for match in _RE_GENERIC_ALLOC.finditer(code):
+            if match.lastgroup == 'new':
+                has_new = True
+            else:
+                has_cstyle = True
+            if has_new and has_cstyle:
+                break
+
+        if has_new:
+            findings.append(
+                CAT_ALLOCATION, SEV_INFO,
+                'Dynamic memory allocation detected')
+
+        if has_cstyle:
+            findings.append(
+                CAT_ALLOCATION, SEV_INFO,
+                'C-style memory allocation detected')
+
         if not findings:
-            findings.append({
-                'category': 'info',
-                'severity': 'info',
-                'message': f'Basic memory analysis for {language} - no issues detected'
-            })
-        
-        return findings
+            findings.append(
+                CAT_INFO, SEV_INFO,
+                f'Basic memory analysis for {language} - no issues detected')
+
+        return findings.to_dicts()
 
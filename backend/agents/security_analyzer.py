@@ -1,7 +1,73 @@
 import re
+from bisect import bisect_right
+from collections import Counter
 from typing import Dict, Any, List
 from .base_agent import BaseAgent
 
+
+def _newline_offsets(code: str) -> List[int]:
+    """Sorted offsets of every newline, built with C-level str.find."""
+    offsets = []
+    find = code.find
+    i = find('\n')
+    while i != -1:
+        offsets.append(i)
+        i = find('\n', i + 1)
+    return offsets
+
+
+# Every security pattern anchors on one of these literals (lowercased;
+# 'rand' also covers random/srand, 'printf' covers sprintf, 'null'
+# covers NULL/nullptr). Clean code — the common case — fails this
+# cheap substring screen and skips the regex pass entirely.
+_LITERAL_TOKENS = ('execute', 'format', 'system', 'subprocess', 'popen',
+                   'password', 'api_key', 'secret', 'token', 'innerhtml',
+                   'document.write', 'rand', 'strcpy', 'strcat', 'gets',
+                   'scanf', 'printf', 'null')
+
+
+def _assert_literal_coverage(patterns: Dict[str, List[str]]) -> None:
+    """
+    Fail at import if any pattern lacks a prescreen literal.
+
+    The prescreen only lets the regex pass run when some literal token
+    appears in the code, so a pattern whose every match contains none
+    of the tokens can simply never fire. Checking the pattern source
+    for a token is a conservative proxy: it caught the
+    subprocess-with-shell=True pattern, which was unreachable until
+    'subprocess' joined the token tuple.
+    """
+    for vuln_type, pats in patterns.items():
+        for pat in pats:
+            # Drop backslashes so escaped literals ('document\.write')
+            # still match their token.
+            low = pat.lower().replace('\\', '')
+            if not any(token in low for token in _LITERAL_TOKENS):
+                raise AssertionError(
+                    f'{vuln_type} pattern {pat!r} contains no prescreen '
+                    f'literal from _LITERAL_TOKENS and would never run')
+
+
+def _fuse_patterns(patterns: Dict[str, List[str]]) -> Dict[str, 're.Pattern']:
+    """
+    Compile one alternation per vulnerability type at import time, so
+    analyze() never touches the re compile cache per call and makes one
+    pass per active type instead of one per individual pattern. Types
+    are deliberately not fused into a single regex: an alternation
+    yields exactly one alternative per position, so co-located matches
+    of different types lose all but one finding (sprintf(buf, s) is
+    both a buffer overflow and a format string bug). Inner capturing
+    groups are rewritten to non-capturing so alternatives compose
+    cleanly.
+    """
+    return {
+        vuln_type: re.compile(
+            '|'.join(re.sub(r'(?<!\\)\((?!\?)', '(?:', pat) for pat in pats),
+            re.IGNORECASE)
+        for vuln_type, pats in patterns.items()
+    }
+
+
 class SecurityAnalyzerAgent(BaseAgent):
     """
     Scans code for security vulnerabilities including:
@@ -56,78 +122,134 @@ class SecurityAnalyzerAgent(BaseAgent):
             r'\*\s*nullptr'
         ]
     }
-    
+
+    _assert_literal_coverage(SECURITY_PATTERNS)
+    _COMPILED_PATTERNS = _fuse_patterns(SECURITY_PATTERNS)
+
+    # Which vulnerability classes are meaningful per language, so e.g.
+    # strcpy/gets patterns never run against Python and Math.random
+    # never runs against C++. Unknown languages fall back to the full
+    # pattern set.
+    _LANG_VULNS = {
+        'python': frozenset({'sql_injection', 'command_injection',
+                             'hardcoded_secrets', 'insecure_random'}),
+        'javascript': frozenset({'xss', 'insecure_random',
+                                 'hardcoded_secrets'}),
+        'typescript': frozenset({'xss', 'insecure_random',
+                                 'hardcoded_secrets'}),
+        'java': frozenset({'sql_injection', 'command_injection',
+                           'hardcoded_secrets', 'insecure_random'}),
+        'cpp': frozenset({'command_injection', 'buffer_overflow',
+                          'format_string', 'null_pointer',
+                          'insecure_random', 'hardcoded_secrets'}),
+        'c': frozenset({'command_injection', 'buffer_overflow',
+                        'format_string', 'null_pointer',
+                        'insecure_random', 'hardcoded_secrets'})
+    }
+
+    # Per-language subsets of the compiled patterns, built on first use
+    # for each language (sharing the import-time pattern objects).
+    _LANG_PATTERNS: Dict[str, Dict[str, 're.Pattern']] = {}
+
+    @classmethod
+    def _patterns_for(cls, language: str) -> Dict[str, 're.Pattern']:
+        """Compiled patterns covering only the vuln types for language."""
+        compiled = cls._LANG_PATTERNS.get(language)
+        if compiled is None:
+            active = cls._LANG_VULNS.get(language)
+            if active is None:
+                compiled = cls._COMPILED_PATTERNS
+            else:
+                compiled = {
+                    vuln_type: pattern
+                    for vuln_type, pattern in cls._COMPILED_PATTERNS.items()
+                    if vuln_type in active}
+            cls._LANG_PATTERNS[language] = compiled
+        return compiled
+
+    # (severity, message, recommendation) per vulnerability type — one
+    # lookup per finding instead of three method calls each rebuilding
+    # its own dict.
+    _VULN_META = {
+        'sql_injection': (
+            'critical',
+            'Potential SQL injection vulnerability detected',
+            'Use parameterized queries or ORM instead of string formatting'),
+        'command_injection': (
+            'critical',
+            'Command injection vulnerability detected',
+            'Avoid shell=True, use subprocess with list arguments'),
+        'buffer_overflow': (
+            'critical',
+            'Buffer overflow vulnerability - unsafe function detected',
+            'Use strncpy, strncat, snprintf instead of unsafe versions'),
+        'format_string': (
+            'high',
+            'Format string vulnerability detected',
+            'Always use format specifier: printf("%s", str) not printf(str)'),
+        'xss': (
+            'high',
+            'Potential XSS vulnerability detected',
+            'Sanitize user input and use textContent instead of innerHTML'),
+        'hardcoded_secrets': (
+            'high',
+            'Hardcoded credential detected',
+            'Use environment variables or secret management systems'),
+        'null_pointer': (
+            'high',
+            'Null pointer dereference risk',
+            'Check for NULL/nullptr before dereferencing pointers'),
+        'insecure_random': (
+            'medium',
+            'Insecure random number generation',
+            'Use cryptographic RNG: secrets module (Python), std::random_device (C++)')
+    }
+
+    _VULN_META_DEFAULT = ('low', 'Security issue detected',
+                          'Review and fix security issue')
+
     def analyze(self, code: str, language: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze code for security vulnerabilities."""
         findings = []
-        
-        for vuln_type, patterns in self.SECURITY_PATTERNS.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, code, re.IGNORECASE)
-                for match in matches:
-                    line_num = code[:match.start()].count('\n') + 1
+
+        low = code.lower()
+        if any(token in low for token in _LITERAL_TOKENS):
+            # Newline index built once on the first hit; each match
+            # then resolves its line in O(log L) instead of rescanning
+            # the prefix, which made dense matches quadratic in code
+            # length.
+            newlines = None
+            for vuln_type, pattern in self._patterns_for(language).items():
+                severity, message, recommendation = self._VULN_META.get(
+                    vuln_type, self._VULN_META_DEFAULT)
+                for match in pattern.finditer(code):
+                    if newlines is None:
+                        newlines = _newline_offsets(code)
+                    line_num = bisect_right(newlines, match.start()) + 1
                     findings.append({
                         'category': 'security',
                         'vulnerability': vuln_type,
-                        'severity': self._get_severity(vuln_type),
+                        'severity': severity,
                         'line': line_num,
                         'code_snippet': match.group(),
-                        'message': self._get_message(vuln_type),
-                        'recommendation': self._get_recommendation(vuln_type)
+                        'message': message,
+                        'recommendation': recommendation
                     })
         
+        # One pass over the findings instead of four filtering
+        # comprehensions (one per severity bucket).
+        by_severity = Counter(f['severity'] for f in findings)
         return {
             "agent": self.name,
             "status": "success",
             "findings": findings,
             "metadata": {
                 "total_vulnerabilities": len(findings),
-                "critical": len([f for f in findings if f['severity'] == 'critical']),
-                "high": len([f for f in findings if f['severity'] == 'high']),
-                "medium": len([f for f in findings if f['severity'] == 'medium']),
-                "low": len([f for f in findings if f['severity'] == 'low'])
+                "critical": by_severity['critical'],
+                "high": by_severity['high'],
+                "medium": by_severity['medium'],
+                "low": by_severity['low']
             }
         }
     
-    def _get_severity(self, vuln_type: str) -> str:
-        """Get severity level for vulnerability type."""
-        severity_map = {
-            'sql_injection': 'critical',
-            'command_injection': 'critical',
-            'buffer_overflow': 'critical',
-            'format_string': 'high',
-            'xss': 'high',
-            'hardcoded_secrets': 'high',
-            'null_pointer': 'high',
-            'insecure_random': 'medium'
-        }
-        return severity_map.get(vuln_type, 'low')
-    
-    def _get_message(self, vuln_type: str) -> str:
-        """Get message for vulnerability type."""
-        messages = {
-            'sql_injection': 'Potential SQL injection vulnerability detected',
-            'command_injection': 'Command injection vulnerability detected',
-            'buffer_overflow': 'Buffer overflow vulnerability - unsafe function detected',
-            'format_string': 'Format string vulnerability detected',
-            'xss': 'Potential XSS vulnerability detected',
-            'hardcoded_secrets': 'Hardcoded credential detected',
-            'null_pointer': 'Null pointer dereference risk',
-            'insecure_random': 'Insecure random number generation'
-        }
-        return messages.get(vuln_type, 'Security issue detected')
-    
-    def _get_recommendation(self, vuln_type: str) -> str:
-        """Get recommendation for vulnerability type."""
-        recommendations = {
-            'sql_injection': 'Use parameterized queries or ORM instead of string formatting',
-            'command_injection': 'Avoid shell=True, use subprocess with list arguments',
-            'buffer_overflow': 'Use strncpy, strncat, snprintf instead of unsafe versions',
-            'format_string': 'Always use format specifier: printf("%s", str) not printf(str)',
-            'xss': 'Sanitize user input and use textContent instead of innerHTML',
-            'hardcoded_secrets': 'Use environment variables or secret management systems',
-            'null_pointer': 'Check for NULL/nullptr before dereferencing pointers',
-            'insecure_random': 'Use cryptographic RNG: secrets module (Python), std::random_device (C++)'
-        }
-        return recommendations.get(vuln_type, 'Review and fix security issue')
 
@@ -1,8 +1,37 @@
+# Eventlet is opt-in: its pin in requirements.txt is commented out
+# (like python-pcre), so threading mode is the default. Under the
+# eventlet hub the whole server shares one OS thread, and anything
+# that blocks it — a real lock, a CPU-bound scan — stalls every
+# connected client at once, which is strictly worse than threading
+# mode unless blocking work is kept off the hub. When eventlet IS
+# installed, the orchestrator offloads analysis to real worker threads
+# via tpool (see run_blocking in orchestrator.workflow_manager), so
+# the hub only ever waits cooperatively. Two deliberate choices here:
+#  - thread stays unpatched, so the orchestrator's shared agent pool
+#    and the tpool workers keep real OS threads; greenified threads
+#    would serialize the CPU-bound scans.
+#  - the except is broad, not just ImportError: eventlet's import and
+#    monkey_patch raise other exception types on newer interpreters,
+#    and a broken patch must degrade to threading mode, not crash the
+#    app at startup.
+try:
+    import eventlet
+    eventlet.monkey_patch(thread=False)
+    _ASYNC_MODE = 'eventlet'
+except Exception:
+    _ASYNC_MODE = 'threading'
+
+import logging
+
 from flask import Flask
 from flask_cors import CORS
 from flask_socketio import SocketIO
 from config import Config
 
+# Root logging is configured once here; the orchestrator and route
+# modules just take named loggers.
+logging.basicConfig(level=logging.INFO)
+
 # Initialize Flask app
 app = Flask(__name__)
 app.config.from_object(Config)
@@ -10,8 +39,27 @@ app.config.from_object(Config)
 # Enable CORS for frontend communication
 CORS(app, resources={r"/*": {"origins": "*"}})
 
+# Serialize responses with orjson when available: analysis reports are
+# large nested dicts and stdlib json dominates response time for them.
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+except ImportError:
+    pass  # stdlib json remains the provider
+
 # Initialize SocketIO for real-time updates
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=_ASYNC_MODE)
 
 # Import and register routes
 from routes.analysis import analysis_bp
@@ -40,4 +88,4 @@ if __name__ == '__main__':
     print("🚀 Starting Multiagent Debugger Backend...")
     print("📡 API running on http://localhost:5000")
     print("🔌 WebSocket available for real-time updates")
-    socketio.run(app, host='0.0.0.0', port=5000, debug=True)
+    socketio.run(app, host='0.0.0.0', port=5000, debug=Config.DEBUG)
@@ -2,6 +2,6 @@
 Orchestrator Module - Coordinates all analysis agents
 """
 
-from .workflow_manager import WorkflowManager
+from .workflow_manager import WorkflowManager, borrow_workflow, run_blocking
 
-__all__ = ['WorkflowManager']
+__all__ = ['WorkflowManager', 'borrow_workflow', 'run_blocking']
@@ -1,6 +1,14 @@
 from typing import Dict, Any, List, Callable
+import copy
+import hashlib
 import logging
+import os
+import queue
+from collections import Counter, OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import MappingProxyType
 from agents import (
     ErrorDetectorAgent,
     ComplexityAnalyzerAgent,
@@ -11,9 +19,34 @@ from agents import (
     FixSuggesterAgent
 )
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Whole-report cache shared by every WorkflowManager: repeated analysis
+# of unchanged code (save-on-keystroke editors, CI retries) returns the
+# compiled report without touching any agent. Same scheme as the
+# per-agent result cache in BaseAgent.run.
+_REPORT_CACHE: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
+_REPORT_CACHE_SIZE = 128
+
+# Severity string -> summary bucket (0 critical, 1 warning, 2 info).
+# Anything unlisted counts as info, matching the old else branch.
+_SEV_BUCKET = {'critical': 0, 'error': 0, 'warning': 1}
+
+# Below this size the agents finish in microseconds and executor
+# dispatch/wakeup dominates, so groups run serially on the request
+# thread instead. Typical editor snippets fall well under it.
+_SMALL_CODE_LIMIT = 10_000
+
+# One persistent executor shared by every workflow, sized to the
+# machine rather than to the request: per-request pools paid thread
+# startup on every call and let concurrent requests spawn unbounded
+# threads. Deliberately not a context manager — the pool lives for the
+# process.
+_AGENT_POOL = ThreadPoolExecutor(
+    max_workers=max(16, (os.cpu_count() or 1) * 2),
+    thread_name_prefix='agent')
+
+
 class WorkflowManager:
     """
     Orchestrates the execution of all analysis agents.
@@ -36,113 +69,201 @@ class WorkflowManager:
             'fix_suggester': FixSuggesterAgent(config)
         }
         
-        # Define agent execution order and dependencies
+        # Define agent execution order and dependencies, filtered once
+        # against the registered agents so the execution loop never
+        # re-checks membership per request.
         self.execution_groups = [
-            # Group 1: Independent agents (parallel)
-            ['error_detector', 'complexity_analyzer', 'memory_profiler', 
-             'security_analyzer', 'quality_checker', 'algorithm_visualizer'],
-            # Group 2: Dependent agents (needs Group 1 results)
-            ['fix_suggester']
+            [name for name in group if name in self.agents]
+            for group in [
+                # Group 1: Independent agents (parallel)
+                ['error_detector', 'complexity_analyzer', 'memory_profiler',
+                 'security_analyzer', 'quality_checker', 'algorithm_visualizer'],
+                # Group 2: Dependent agents (needs Group 1 results)
+                ['fix_suggester']
+            ]
         ]
     
     def set_status_callback(self, callback: Callable):
         """Set callback function for real-time status updates."""
         self.status_callback = callback
     
-    def analyze(self, code: str, language: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+    def analyze(self, code: str, language: str, context: Dict[str, Any] = None,
+                force: bool = False) -> Dict[str, Any]:
         """
         Execute all agents in optimal order.
-        
+
         Args:
             code: Source code to analyze
             language: Programming language
             context: Additional context
-            
+            force: Bypass the report cache and recompute
+
         Returns:
             Aggregated results from all agents
         """
         context = context or {}
+        # Key on everything that can change the report.
+        cache_key = (
+            hashlib.blake2b(code.encode(), digest_size=16).digest(),
+            language,
+            repr(sorted(self.config.items(), key=lambda kv: kv[0])),
+            repr(sorted(context.items(), key=lambda kv: kv[0]))
+        )
+        if not force:
+            cached = _REPORT_CACHE.get(cache_key)
+            if cached is not None:
+                _REPORT_CACHE.move_to_end(cache_key)
+                logger.info("✅ Analysis served from report cache")
+                self._update_status("completed", "Analysis complete (cached)")
+                return copy.deepcopy(cached)
         self.results = {}
-        
-        logger.info(f"🚀 Starting multiagent analysis for {language}...")
+
+        logger.info("🚀 Starting multiagent analysis for %s...", language)
         self._update_status("started", "Initiating analysis workflow")
         
         # Execute agent groups in sequence
         for group_idx, agent_group in enumerate(self.execution_groups):
-            logger.info(f"📦 Executing agent group {group_idx + 1}/{len(self.execution_groups)}")
+            # Dependent groups exist to act on earlier findings; when
+            # Group 1 came back clean there is nothing for the
+            # fix_suggester to suggest, so record it as skipped instead
+            # of paying its run.
+            if group_idx > 0 and not any(
+                    result.get('findings')
+                    for result in self.results.values()):
+                for agent_name in agent_group:
+                    self.results[agent_name] = {
+                        "agent": agent_name,
+                        "status": "skipped",
+                        "findings": []
+                    }
+                continue
+            logger.info("📦 Executing agent group %d/%d", group_idx + 1,
+                        len(self.execution_groups))
             self._execute_agent_group(agent_group, code, language, context)
         
         # Compile final report
         final_report = self._compile_report()
-        
+
+        _REPORT_CACHE[cache_key] = copy.deepcopy(final_report)
+        if len(_REPORT_CACHE) > _REPORT_CACHE_SIZE:
+            _REPORT_CACHE.popitem(last=False)
+
         logger.info("✅ Multiagent analysis completed successfully")
         self._update_status("completed", "Analysis complete")
-        
+
         return final_report
     
     def _execute_agent_group(self, agent_names: List[str], code: str, 
                             language: str, context: Dict[str, Any]):
-        """Execute a group of agents in parallel."""
-        
-        with ThreadPoolExecutor(max_workers=len(agent_names)) as executor:
-            # Submit all agents in this group
-            future_to_agent = {}
+        """Execute a group of agents in parallel on the shared pool."""
+
+        # Snapshot of results from earlier groups, taken once before any
+        # submit. Passing the live self.results handed worker threads a
+        # dict the collection loop mutates concurrently; the snapshot
+        # gives every agent in the group the same frozen view of its
+        # completed predecessors and never of in-flight peers.
+        prior_results = dict(self.results)
+
+        # Agents only read the context, so one read-only view serves
+        # the whole group instead of a fresh dict copy per agent. An
+        # agent that ever needs a private writable copy can dict() it.
+        agent_context = MappingProxyType(
+            {**context, 'all_findings': prior_results})
+
+        # Fast path: small inputs and single-agent groups gain nothing
+        # from the pool — the agents finish faster than the dispatch
+        # and wakeup cost — so run them serially on this thread.
+        if len(agent_names) == 1 or len(code) < _SMALL_CODE_LIMIT:
             for agent_name in agent_names:
-                if agent_name not in self.agents:
-                    continue
-                
                 agent = self.agents[agent_name]
                 self._update_status("running", f"Running {agent_name}")
-                
-                # Prepare context (add previous results for dependent agents)
-                agent_context = context.copy()
-                agent_context['all_findings'] = self.results
-                
-                # Submit agent execution
-                future = executor.submit(agent.run, code, language, agent_context)
-                future_to_agent[future] = agent_name
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_agent):
-                agent_name = future_to_agent[future]
                 try:
-                    result = future.result()
-                    self.results[agent_name] = result
-                    logger.info(f"✓ {agent_name} completed")
-                    self._update_status("progress", f"{agent_name} completed")
+                    result = agent.run(code, language, agent_context)
                 except Exception as e:
-                    logger.error(f"✗ {agent_name} failed: {str(e)}")
-                    self.results[agent_name] = {
-                        "agent": agent_name,
-                        "status": "error",
-                        "error": str(e),
-                        "findings": []
-                    }
+                    self._record_failure(agent_name, e)
+                else:
+                    self._record_result(agent_name, result)
+            return
+
+        # Submit all agents in this group (names were validated against
+        # self.agents when the groups were built)
+        future_to_agent = {}
+        for agent_name in agent_names:
+            agent = self.agents[agent_name]
+            self._update_status("running", f"Running {agent_name}")
+
+            # Submit agent execution
+            future = _AGENT_POOL.submit(agent.run, code, language, agent_context)
+            future_to_agent[future] = agent_name
+
+        # Collect results as they complete
+        for future in as_completed(future_to_agent):
+            agent_name = future_to_agent[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                self._record_failure(agent_name, e)
+            else:
+                self._record_result(agent_name, result)
+
+    def _record_result(self, agent_name: str, result: Dict[str, Any]):
+        """Store a completed agent result and stream it to clients."""
+        self.results[agent_name] = result
+        logger.info("✓ %s completed", agent_name)
+        # Stream the partial result so clients can render each agent as
+        # it finishes instead of waiting for the whole workflow to land
+        # in one analysis_complete payload.
+        self._update_status("agent_result", f"{agent_name} completed",
+                            {"agent": agent_name, "result": result})
+
+    def _record_failure(self, agent_name: str, error: Exception):
+        """Store the standard error result for a failed agent."""
+        logger.error("✗ %s failed: %s", agent_name, error)
+        self.results[agent_name] = {
+            "agent": agent_name,
+            "status": "error",
+            "error": str(error),
+            "findings": []
+        }
     
     def _compile_report(self) -> Dict[str, Any]:
         """Compile aggregated report from all agent results."""
         
-        total_findings = 0
-        critical_issues = 0
-        warnings = 0
-        infos = 0
-        
-        # Count findings across all agents
-        for agent_name, result in self.results.items():
-            findings = result.get('findings', [])
-            total_findings += len(findings)
-            
-            for finding in findings:
-                severity = finding.get('severity', 'info')
-                if severity in ['critical', 'error']:
-                    critical_issues += 1
-                elif severity == 'warning':
-                    warnings += 1
-                else:
-                    infos += 1
+        # Merge every agent's findings into one flat list up front;
+        # the severity tally reads it and it ships on the report so
+        # downstream consumers never re-flatten per agent.
+        all_findings = []
+        extend = all_findings.extend
+        for result in self.results.values():
+            extend(result.get('findings', ()))
+
+        severities = [finding.get('severity', 'info')
+                      for finding in all_findings]
+        total_findings = len(severities)
+        # Bucket the handful of distinct severity strings rather than
+        # branching per finding.
+        buckets = [0, 0, 0]
+        for severity, n in Counter(severities).items():
+            buckets[_SEV_BUCKET.get(severity, 2)] += n
+        critical_issues, warnings, infos = buckets
         
         # Extract visualizations if available
         visualizations = self.results.get('algorithm_visualizer', {}).get('visualizations', [])
+
+        # The step list is surfaced at the top level of the report;
+        # repeating it inside agent_results made the serializer encode
+        # the largest payload in the response twice. Strip the nested
+        # copy (shallowly, so the agent's own result dict is untouched).
+        agent_results = self.results
+        viz_result = agent_results.get('algorithm_visualizer')
+        if viz_result and 'visualizations' in viz_result:
+            agent_results = {
+                **agent_results,
+                'algorithm_visualizer': {
+                    k: v for k, v in viz_result.items()
+                    if k != 'visualizations'
+                }
+            }
         
         # Get quality score
         quality_score = self.results.get('quality_checker', {}).get('metadata', {}).get('quality_score', 0)
@@ -160,24 +281,29 @@ class WorkflowManager:
                 "quality_score": quality_score,
                 "complexity": complexity_metadata
             },
-            "agent_results": self.results,
+            "agent_results": agent_results,
+            "all_findings": all_findings,
             "visualizations": visualizations,
             "timestamp": self._get_timestamp()
         }
     
-    def _update_status(self, status: str, message: str):
+    def _update_status(self, status: str, message: str,
+                       data: Dict[str, Any] = None):
         """Send status update via callback if available."""
         if self.status_callback:
-            self.status_callback({
+            event = {
                 "status": status,
                 "message": message,
                 "timestamp": self._get_timestamp()
-            })
+            }
+            if data:
+                event.update(data)
+            self.status_callback(event)
     
     def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat() + 'Z'
+        """Get current UTC timestamp, millisecond precision."""
+        return datetime.now(timezone.utc).isoformat(
+            timespec='milliseconds').replace('+00:00', 'Z')
     
     def get_agent_statuses(self) -> Dict[str, Any]:
         """Get current status of all agents."""
@@ -185,3 +311,54 @@ class WorkflowManager:
         for name, agent in self.agents.items():
             statuses[name] = agent.get_status()
         return statuses
+
+
+# Under the (opt-in) eventlet async mode the whole server shares one
+# OS thread; a request greenlet that calls workflow.analyze directly
+# parks the hub on real locks in as_completed and stalls every other
+# client. tpool hands the call to a real worker thread and lets the
+# greenlet wait cooperatively. In threading mode this resolves to a
+# plain call.
+try:
+    from eventlet import patcher as _eventlet_patcher
+    from eventlet import tpool as _tpool
+    _EVENTLET_ACTIVE = _eventlet_patcher.is_monkey_patched('socket')
+except Exception:
+    _EVENTLET_ACTIVE = False
+
+
+def run_blocking(func, *args, **kwargs):
+    """Run a blocking call without suspending the eventlet hub."""
+    if _EVENTLET_ACTIVE:
+        return _tpool.execute(func, *args, **kwargs)
+    return func(*args, **kwargs)
+
+
+# Reusable WorkflowManager instances. Constructing one builds all seven
+# agents (and their compiled patterns and caches), which is pure waste
+# to repeat per request — instances hold no request state between
+# analyze() calls once results and the callback are reset.
+_POOL_SIZE = 4
+_workflow_pool: 'queue.Queue[WorkflowManager]' = queue.Queue()
+
+
+@contextmanager
+def borrow_workflow():
+    """
+    Yield a pooled WorkflowManager, creating one if the pool is empty.
+
+    Each borrowed instance serves exactly one request at a time; its
+    per-request state is cleared before it goes back so a later
+    borrower never sees a stale callback or results dict.
+    """
+    try:
+        workflow = _workflow_pool.get_nowait()
+    except queue.Empty:
+        workflow = WorkflowManager()
+    try:
+        yield workflow
+    finally:
+        workflow.results = {}
+        workflow.status_callback = None
+        if _workflow_pool.qsize() < _POOL_SIZE:
+            _workflow_pool.put(workflow)
@@ -1,13 +1,67 @@
-from flask import Blueprint, request, jsonify
-from orchestrator import WorkflowManager
+from flask import Blueprint, Response, request, jsonify
+from orchestrator import borrow_workflow, run_blocking
 from config import Config
+import json
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 analysis_bp = Blueprint('analysis', __name__)
 
+# The /agents payload is a pure function of Config, which is fixed at
+# startup — serialize it once at import instead of rebuilding seven
+# dicts and re-counting enabled flags per GET.
+_AGENTS = [
+    {
+        "name": "Error Detector",
+        "id": "error_detector",
+        "description": "Detects syntax, runtime, and logical errors",
+        "enabled": Config.ENABLE_ERROR_DETECTION
+    },
+    {
+        "name": "Complexity Analyzer",
+        "id": "complexity_analyzer",
+        "description": "Analyzes time/space complexity and code metrics",
+        "enabled": Config.ENABLE_COMPLEXITY_ANALYSIS
+    },
+    {
+        "name": "Memory Profiler",
+        "id": "memory_profiler",
+        "description": "Profiles memory usage and detects leaks",
+        "enabled": Config.ENABLE_MEMORY_PROFILING
+    },
+    {
+        "name": "Security Analyzer",
+        "id": "security_analyzer",
+        "description": "Scans for security vulnerabilities",
+        "enabled": Config.ENABLE_SECURITY_ANALYSIS
+    },
+    {
+        "name": "Quality Checker",
+        "id": "quality_checker",
+        "description": "Checks code quality and best practices",
+        "enabled": Config.ENABLE_QUALITY_CHECK
+    },
+    {
+        "name": "Algorithm Visualizer",
+        "id": "algorithm_visualizer",
+        "description": "Visualizes algorithms and data structures",
+        "enabled": Config.ENABLE_ALGORITHM_VISUALIZATION
+    },
+    {
+        "name": "Fix Suggester",
+        "id": "fix_suggester",
+        "description": "Generates intelligent fix suggestions",
+        "enabled": Config.ENABLE_FIX_SUGGESTIONS
+    }
+]
+
+_AGENTS_JSON = json.dumps({
+    "agents": _AGENTS,
+    "total": len(_AGENTS),
+    "enabled": sum(1 for a in _AGENTS if a['enabled'])
+})
+
 @analysis_bp.route('/analyze', methods=['POST'])
 def analyze_code():
     """
@@ -53,16 +107,18 @@ def analyze_code():
                 "message": f"Code size exceeds limit ({Config.MAX_CODE_SIZE} bytes)"
             }), 400
         
-        logger.info(f"📝 Received analysis request for {language} ({len(code)} bytes)")
+        logger.info("📝 Received analysis request for %s (%d bytes)",
+                    language, len(code))
         
-        # Create workflow manager and run analysis
-        workflow = WorkflowManager()
-        result = workflow.analyze(code, language, context)
+        # Borrow a pooled workflow manager and run analysis off the
+        # hub (run_blocking is a plain call under threading mode)
+        with borrow_workflow() as workflow:
+            result = run_blocking(workflow.analyze, code, language, context)
         
         return jsonify(result), 200
         
     except Exception as e:
-        logger.error(f"❌ Analysis failed: {str(e)}")
+        logger.error("❌ Analysis failed: %s", e)
         return jsonify({
             "status": "error",
             "message": str(e)
@@ -78,53 +134,4 @@ def get_supported_languages():
 @analysis_bp.route('/agents', methods=['GET'])
 def get_agent_info():
     """Get information about available agents."""
-    agents = [
-        {
-            "name": "Error Detector",
-            "id": "error_detector",
-            "description": "Detects syntax, runtime, and logical errors",
-            "enabled": Config.ENABLE_ERROR_DETECTION
-        },
-        {
-            "name": "Complexity Analyzer",
-            "id": "complexity_analyzer",
-            "description": "Analyzes time/space complexity and code metrics",
-            "enabled": Config.ENABLE_COMPLEXITY_ANALYSIS
-        },
-        {
-            "name": "Memory Profiler",
-            "id": "memory_profiler",
-            "description": "Profiles memory usage and detects leaks",
-            "enabled": Config.ENABLE_MEMORY_PROFILING
-        },
-        {
-            "name": "Security Analyzer",
-            "id": "security_analyzer",
-            "description": "Scans for security vulnerabilities",
-            "enabled": Config.ENABLE_SECURITY_ANALYSIS
-        },
-        {
-            "name": "Quality Checker",
-            "id": "quality_checker",
-            "description": "Checks code quality and best practices",
-            "enabled": Config.ENABLE_QUALITY_CHECK
-        },
-        {
-            "name": "Algorithm Visualizer",
-            "id": "algorithm_visualizer",
-            "description": "Visualizes algorithms and data structures",
-            "enabled": Config.ENABLE_ALGORITHM_VISUALIZATION
-        },
-        {
-            "name": "Fix Suggester",
-            "id": "fix_suggester",
-            "description": "Generates intelligent fix suggestions",
-            "enabled": Config.ENABLE_FIX_SUGGESTIONS
-        }
-    ]
-    
-    return jsonify({
-        "agents": agents,
-        "total": len(agents),
-        "enabled": len([a for a in agents if a['enabled']])
-    }), 200
+    return Response(_AGENTS_JSON, mimetype='application/json')
@@ -1,61 +1,128 @@
+import threading
+from collections import deque
+
+from flask import request
 from flask_socketio import emit
-from orchestrator import WorkflowManager
+from orchestrator import borrow_workflow, run_blocking
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# How long to buffer status events before flushing them as one frame.
+_FLUSH_INTERVAL = 0.025
+
+
+class StatusBatcher:
+    """
+    Coalesces per-agent status updates into batched WebSocket emits.
+
+    Every agent transition used to go out as its own 'status_update'
+    frame — with seven agents that is a dozen-plus tiny socket writes
+    per analysis, each paying framing overhead. feed() buffers events;
+    a background drain task started from the handler flushes the buffer
+    every interval as a single 'status_update_batch' message, and
+    stop() emits whatever is left.
+
+    The drain task is scheduled with socketio.start_background_task /
+    socketio.sleep, which resolve to the right primitive for the
+    active async mode (greenlet under eventlet, thread under
+    threading); a raw threading.Timer emitted from a foreign OS
+    thread, which the eventlet hub does not support. feed() itself
+    only touches the buffer, so it is safe to call from the tpool
+    worker running the analysis.
+    """
+
+    def __init__(self, socketio, sid, flush_interval=_FLUSH_INTERVAL):
+        self._socketio = socketio
+        self._sid = sid
+        self._flush_interval = flush_interval
+        self._buffer = deque()
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self):
+        """Start the periodic drain task (call from the handler)."""
+        self._running = True
+        self._socketio.start_background_task(self._drain)
+
+    def stop(self):
+        """Stop the drain task and emit anything still buffered."""
+        self._running = False
+        self.flush()
+
+    def _drain(self):
+        while self._running:
+            self._socketio.sleep(self._flush_interval)
+            self.flush()
+
+    def feed(self, event):
+        """Buffer one status event for the next flush."""
+        with self._lock:
+            self._buffer.append(event)
+
+    def flush(self):
+        """Emit everything buffered so far as one batch frame."""
+        with self._lock:
+            if not self._buffer:
+                return
+            events = list(self._buffer)
+            self._buffer.clear()
+        self._socketio.emit('status_update_batch', {'events': events},
+                            to=self._sid)
+
+
 def register_websocket_handlers(socketio):
     """Register WebSocket event handlers for real-time updates."""
-    
+
     @socketio.on('connect')
     def handle_connect():
         """Handle client connection."""
         logger.info('🔌 Client connected via WebSocket')
         emit('connected', {'message': 'Connected to Multiagent Debugger'})
-    
+
     @socketio.on('disconnect')
     def handle_disconnect():
         """Handle client disconnection."""
         logger.info('🔌 Client disconnected')
-    
+
     @socketio.on('analyze')
     def handle_analyze(data):
         """
         Handle real-time analysis request.
-        
+
         Emits progress updates as agents complete.
         """
+        batcher = StatusBatcher(socketio, request.sid)
+        batcher.start()
         try:
             code = data.get('code', '')
             language = data.get('language', 'python')
             context = data.get('context', {})
-            
-            logger.info(f'📡 WebSocket analysis request for {language}')
-            
-            # Create workflow with status callback
-            workflow = WorkflowManager()
-            
-            def status_callback(status_data):
-                """Emit status updates to client."""
-                emit('status_update', status_data)
-            
-            workflow.set_status_callback(status_callback)
-            
-            # Run analysis
-            emit('analysis_started', {'message': 'Analysis started'})
-            result = workflow.analyze(code, language, context)
-            
-            # Send final result
+
+            logger.info('📡 WebSocket analysis request for %s', language)
+
+            # Borrow a pooled workflow with status callback
+            with borrow_workflow() as workflow:
+                workflow.set_status_callback(batcher.feed)
+
+                # Run analysis off the hub (plain call under threading)
+                emit('analysis_started', {'message': 'Analysis started'})
+                result = run_blocking(workflow.analyze, code, language,
+                                      context)
+
+            # Drain any buffered updates before the final result so the
+            # client never sees progress arrive after completion.
+            batcher.stop()
             emit('analysis_complete', result)
-            
+
         except Exception as e:
-            logger.error(f'❌ WebSocket analysis failed: {str(e)}')
+            logger.error('❌ WebSocket analysis failed: %s', e)
+            batcher.stop()
             emit('analysis_error', {'error': str(e)})
-    
+
     @socketio.on('get_agent_status')
     def handle_get_agent_status():
         """Get current status of all agents."""
-        workflow = WorkflowManager()
-        statuses = workflow.get_agent_statuses()
+        with borrow_workflow() as workflow:
+            statuses = workflow.get_agent_statuses()
         emit('agent_statuses', statuses)
@@ -1,12 +1,51 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import './AlgorithmCanvas.css';
 
+// Expand delta-encoded sorting frames ({step, op, idx}) into the full
+// frame objects the renderers consume, replaying each compare/swap
+// against the initial sample array. Messages come from the lookup
+// table shipped alongside the deltas.
+const expandDeltaFrames = (visualization) => {
+    const deltas = visualization?.frames || [];
+    if (visualization?.frame_schema !== 'delta_v1') return deltas;
+
+    const arr = [...(visualization.sample_data || [])];
+    const messages = visualization.messages || {};
+    const n = arr.length;
+    let pass = 0;
+    const frames = [];
+
+    deltas.forEach((delta) => {
+        const [i, j] = delta.idx;
+        // Bubble sort restarts its inner loop at index 0 on each pass;
+        // every completed pass pins one more element at the tail.
+        if (delta.op === 'compare' && i === 0 && frames.length > 0) pass += 1;
+
+        const key = `${arr[i]},${arr[j]}`;
+        const frame = {
+            step: delta.step,
+            operation: delta.op,
+            sorted: Array.from({ length: pass }, (_, k) => n - pass + k),
+            message: (messages[delta.op] || {})[key] || '',
+        };
+        if (delta.op === 'swap') {
+            [arr[i], arr[j]] = [arr[j], arr[i]];
+            frame.swapping = [i, j];
+        } else {
+            frame.comparing = [i, j];
+        }
+        frame.array = [...arr];
+        frames.push(frame);
+    });
+    return frames;
+};
+
 const AlgorithmCanvas = ({ visualization }) => {
     const [currentFrame, setCurrentFrame] = useState(0);
     const [isPlaying, setIsPlaying] = useState(false);
     const [speed, setSpeed] = useState(1);
 
-    const frames = visualization?.frames || [];
+    const frames = useMemo(() => expandDeltaFrames(visualization), [visualization]);
     const metrics = visualization?.metrics || {};
     const type = visualization?.type || '';
     const memoryAnalysis = visualization?.memory_analysis || {};